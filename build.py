@@ -0,0 +1,1363 @@
+# build.py
+"""
+Build Shadow AI - one builder for every build flavour
+
+Usage: python build.py [--mode {gui,onefile,installer,ci,step}]... [--release]
+
+Several modes can be given at once; steps they share (dependency
+installation, bytecode precompile, the PyInstaller build itself) run once.
+Set FORCE_CLEAN=1 to rebuild without any cached PyInstaller state.
+"""
+
+import os
+import sys
+import platform
+import subprocess
+import shutil
+import sysconfig
+import zipfile
+import zlib
+import hashlib
+import importlib.metadata
+import asyncio
+import argparse
+import re
+import tarfile
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+try:
+    import zstandard
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
+# Requirement parsing - pip vendors packaging, so it is there whenever pip is
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+except ImportError:
+    try:
+        from pip._vendor.packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:
+        Requirement = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Host platform, queried once
+PLATFORM_SYSTEM = platform.system()
+PLATFORM_RELEASE = platform.release()
+PYTHON_VERSION = platform.python_version()
+
+# Project root - every path below is relative to it
+HERE = Path(__file__).resolve().parent
+
+# Files every build needs
+REQUIRED_FILES = [
+    'run_shadow_gui.py',
+    'shadow_core/gui.py',
+    'shadow_core/brain.py',
+    'config.example.py',
+    'requirements.txt'
+]
+
+# Modules the app never imports (tkinter stays: customtkinter needs it,
+# and so does PIL.ImageTk for CTkImage)
+EXCLUDED_MODULES = [
+    'test', 'unittest', 'pydoc', 'pydoc_data', 'doctest', 'xmlrpc',
+    'pdb', 'lib2to3', 'distutils', 'setuptools._vendor',
+    'tkinter.test', 'pip'
+]
+
+# Tagged CI builds ship a single exe; everything else uses the faster --onedir
+RELEASE_BUILD = os.getenv('GITHUB_REF', '').startswith('refs/tags/') or '--release' in sys.argv[1:]
+
+# FORCE_CLEAN=1 rebuilds from scratch, ignoring every PyInstaller cache
+FORCE_CLEAN = os.getenv('FORCE_CLEAN') == '1'
+
+# Build output (Linux gets a lowercase binary name)
+APP_NAME = 'shadow-ai' if PLATFORM_SYSTEM == 'Linux' else 'ShadowAI'
+EXE_NAME = f"{APP_NAME}.exe" if PLATFORM_SYSTEM == 'Windows' else APP_NAME
+BUNDLE_DIR = Path("dist") / APP_NAME
+
+# PyInstaller intermediates go to RAM-backed /dev/shm on Linux, %TEMP% elsewhere
+if sys.platform == 'linux' and os.path.isdir('/dev/shm'):
+    WORK_DIR = Path('/dev/shm') / 'pyi-build'
+else:
+    WORK_DIR = Path(tempfile.gettempdir()) / 'pyi-build'
+
+# Final traceback/abort lines after which PyInstaller cannot recover
+FATAL_BUILD_OUTPUT = re.compile(r'^(ModuleNotFoundError|(pefile\.)?PEFormatError|Fatal Python error|MemoryError)\b')
+
+# Build cache (restored across CI runs, see .github/workflows/build.yml)
+BUILD_CACHE_DIR = Path(".build_cache")
+PIP_CACHE_DIR = BUILD_CACHE_DIR / "pip"
+REQUIREMENTS_HASH_FILE = BUILD_CACHE_DIR / "req.hash"
+IMPORTS_OK_FILE = BUILD_CACHE_DIR / "imports_ok.hash"
+PYINSTALLER_CACHE_BACKUP = BUILD_CACHE_DIR / "pyi"
+PYINSTALLER_PARALLEL_DIR = BUILD_CACHE_DIR / "pyi_parallel"
+
+# PyInstaller spec and analysis reuse
+SPEC_FILE = Path(f"{APP_NAME}.spec")
+SPEC_HASH_FILE = BUILD_CACHE_DIR / "spec.hash"
+ANALYSIS_TOC = WORK_DIR / APP_NAME / "Analysis-00.toc"
+ANALYSIS_CACHE_DIR = BUILD_CACHE_DIR / "pyi_analysis"
+# Top-level modules bundled next to shadow_core (run_shadow_gui imports main)
+APP_MODULES = ['run_shadow_gui.py', 'main.py']
+
+# The Analysis TOC and the work files it points at; a reused TOC skips
+# regenerating the stdlib archive and the compiled project modules
+ANALYSIS_FILES = ["Analysis-00.toc", "base_library.zip", "localpycs"]
+
+# Cross-run cache archive and the key file CI hashes to name it
+CI_CACHE_ARCHIVE = Path("ci-cache.tar.zst" if HAS_ZSTANDARD else "ci-cache.tar")
+CI_CACHE_KEY_FILE = Path("cache_key")
+
+# Build tools installed alongside requirements.txt - newer pefile releases
+# make PyInstaller's binary scan take tens of minutes
+BUILD_TOOLS = ['pyinstaller>=6.3', 'pefile==2023.2.7']
+
+# Compiled packages that must come from wheels: a silent source build of these
+# takes minutes, so fail the install instead (pyaudio has no Linux wheels)
+BINARY_ONLY_PACKAGES = ['pygame', 'psutil', 'numpy', 'pillow']
+
+# Runtime packages not pinned in requirements.txt that the CI import test needs
+CI_GUI_DEPENDENCIES = ['customtkinter', 'pygame', 'psutil', 'requests']
+
+# Files that barely shrink under DEFLATE
+PACKED_SUFFIXES = {'.exe', '.dll', '.pyd', '.zip'}
+
+# Linux ioctl that clones a file copy-on-write (Btrfs, XFS)
+FICLONE = 0x40049409
+
+# Trees cleanup() never needs to search for __pycache__
+CLEANUP_SKIP_DIRS = {'dist', 'build', '.git', '.venv', 'venv', 'node_modules', '.build_cache'}
+
+# Multithreaded archiver, if installed (GitHub's Windows runners ship it)
+SEVEN_ZIP = shutil.which('7z')
+
+# CI marker variables, most specific first
+CI_VARS = {
+    'GITHUB_ACTIONS': 'GitHub Actions',
+    'GITLAB_CI': 'GitLab CI',
+    'TRAVIS': 'Travis CI',
+    'CIRCLECI': 'CircleCI',
+    'CI': 'Generic CI'
+}
+
+def detect_ci_environment():
+    """Detect CI environment and adjust build accordingly"""
+    return next((name for var, name in CI_VARS.items() if os.getenv(var)), 'Local')
+
+CI_ENVIRONMENT = detect_ci_environment()
+
+def built_exe(release=RELEASE_BUILD):
+    """Path of the executable PyInstaller produces"""
+    return Path("dist") / EXE_NAME if release else BUNDLE_DIR / EXE_NAME
+
+def find_missing_files(required_files, base_dir="."):
+    """Return the required files that don't exist, reading each directory once"""
+    existing_by_parent = {}
+    missing_files = []
+    
+    for file_path in required_files:
+        parent, _, name = file_path.rpartition('/')
+        if parent not in existing_by_parent:
+            try:
+                with os.scandir(os.path.join(base_dir, parent or '.')) as entries:
+                    existing_by_parent[parent] = {os.path.normcase(e.name) for e in entries}
+            except OSError:
+                existing_by_parent[parent] = set()
+        
+        if os.path.normcase(name) not in existing_by_parent[parent]:
+            missing_files.append(file_path)
+    
+    return missing_files
+
+def check_requirements(windows_only=False, extra_files=()):
+    """Check if all requirements are met"""
+    print("🔍 Checking requirements...")
+    
+    # Check platform
+    if PLATFORM_SYSTEM != 'Windows':
+        if windows_only:
+            print("❌ This build is for Windows only!")
+            print("💡 Please run on Windows 10/11")
+            return False
+        print("⚠️  Warning: This build is optimized for Windows")
+    
+    # main.py relies on asyncio.to_thread and loop-agnostic asyncio.Lock
+    if sys.version_info < (3, 10):
+        print(f"❌ Python 3.10+ is required (found {PYTHON_VERSION})")
+        return False
+    
+    # Check required files
+    missing_files = find_missing_files(REQUIRED_FILES + list(extra_files))
+    
+    if missing_files:
+        print("❌ Missing required files:")
+        for missing in missing_files:
+            print(f"   - {missing}")
+        return False
+    
+    print("✅ All requirements met")
+    return True
+
+def requirements_hash():
+    """Return the sha256 of requirements.txt"""
+    return hashlib.sha256(Path('requirements.txt').read_bytes()).hexdigest()
+
+def requirements_installed(requirements):
+    """Check that every requirement line is installed at a version it allows"""
+    if Requirement is None:
+        return False
+    
+    for line in requirements:
+        line = line.split('#', 1)[0].strip()
+        if not line or line.startswith('-'):
+            continue
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            return False
+        if requirement.marker and not requirement.marker.evaluate():
+            continue
+        try:
+            version = importlib.metadata.version(requirement.name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        if not requirement.specifier.contains(version, prereleases=True):
+            return False
+    return True
+
+def dependencies_up_to_date(req_hash, packages=()):
+    """Check if the environment already satisfies the cached requirements"""
+    if not REQUIREMENTS_HASH_FILE.exists():
+        return False
+    if REQUIREMENTS_HASH_FILE.read_text().strip() != req_hash:
+        return False
+    
+    # The hash file can outlive the environment it describes (a new venv,
+    # a package uninstalled since), so check what is actually installed
+    requirements = Path('requirements.txt').read_text().splitlines() + list(packages)
+    if not requirements_installed(requirements):
+        return False
+    
+    # pip check verifies the installed set is consistent
+    result = subprocess.run([sys.executable, '-m', 'pip', 'check'], capture_output=True)
+    return result.returncode == 0
+
+async def run_pip(args, env):
+    """Run a pip command without blocking the event loop"""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, args, stderr=stderr)
+
+async def install_dependencies(extra_packages=()):
+    """Install required dependencies"""
+    print("📦 Installing dependencies...")
+    
+    # The hash covers the extra packages too, so adding one reinstalls
+    req_hash = hashlib.sha256(
+        requirements_hash().encode() + ' '.join(extra_packages).encode()
+    ).hexdigest()
+    if dependencies_up_to_date(req_hash, BUILD_TOOLS + list(extra_packages)):
+        print("✅ Dependencies already up to date (requirements.txt unchanged)")
+        return True
+    
+    # Reuse the wheel cache and skip .pyc generation at install time
+    pip_install = [
+        sys.executable, '-m', 'pip', 'install',
+        '--cache-dir', str(PIP_CACHE_DIR),
+        '--prefer-binary',
+        f"--only-binary={','.join(BINARY_ONLY_PACKAGES)}",
+        '--no-compile',
+        '--disable-pip-version-check'
+    ]
+    env = {**os.environ, 'PIP_NO_INPUT': '1'}
+    
+    try:
+        # Upgrade pip first - pip must not replace itself under a running install
+        await run_pip(pip_install + ['--upgrade', 'pip'], env)
+        
+        # Requirements, build tools and extras in one resolver pass, so pip
+        # downloads them together and no two installs touch site-packages at once
+        await run_pip(pip_install + [
+            '-r', 'requirements.txt',
+            *BUILD_TOOLS,
+            *extra_packages
+        ], env)
+        
+        # Remember the requirements we installed
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        REQUIREMENTS_HASH_FILE.write_text(req_hash)
+        
+        print("✅ Dependencies installed successfully")
+        return True
+    
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Dependency installation failed: {e}")
+        return False
+
+def test_gui_imports():
+    """Test that all GUI modules can be imported"""
+    print("🧪 Testing GUI imports...")
+    
+    # The result only changes with the requirements or the project sources
+    imports_key = hashlib.sha256(
+        requirements_hash().encode() + source_hash(sorted(Path('shadow_core').rglob('*.py'))).encode()
+    ).hexdigest()
+    if IMPORTS_OK_FILE.exists() and IMPORTS_OK_FILE.read_text() == imports_key:
+        print("✅ GUI imports already verified (requirements and shadow_core unchanged)")
+        return True
+    
+    test_code = """
+import sys
+sys.path.append('.')
+
+try:
+    # Core dependencies
+    import customtkinter
+    import openai
+    import pygame
+    import psutil
+    import requests
+    import asyncio
+    import threading
+
+    # Project modules
+    from shadow_core.gui import ShadowGUI
+    from shadow_core.brain import ShadowBrain
+
+    print("SUCCESS: All imports working")
+    sys.exit(0)
+
+except ImportError as e:
+    print(f"IMPORT_ERROR: {e}")
+    sys.exit(1)
+except Exception as e:
+    print(f"OTHER_ERROR: {e}")
+    sys.exit(1)
+"""
+
+    try:
+        returncode, output = run_streamed([sys.executable, '-c', test_code], timeout=30)
+        
+        if returncode == 0:
+            BUILD_CACHE_DIR.mkdir(exist_ok=True)
+            IMPORTS_OK_FILE.write_text(imports_key)
+            print("✅ All GUI imports successful")
+            return True
+        else:
+            print(f"❌ Import test failed: {output}")
+            return False
+    
+    except subprocess.TimeoutExpired:
+        print("❌ Import test timed out")
+        return False
+
+def precompile_bytecode():
+    """Compile site-packages and project sources to bytecode on all cores"""
+    print("⚙️  Precompiling bytecode...")
+    
+    # PyInstaller's analysis reuses fresh __pycache__ entries instead of
+    # compiling every module itself, one at a time
+    paths = sorted({sysconfig.get_paths()['purelib'], sysconfig.get_paths()['platlib']})
+    paths += ['shadow_core', 'run_shadow_gui.py', 'main.py']
+    
+    result = subprocess.run(
+        [sys.executable, '-m', 'compileall', '-j', '0', '-q'] + paths,
+        capture_output=True, text=True
+    )
+    
+    # Unparsable third-party test files are not fatal for the build
+    if result.returncode != 0:
+        print("⚠️  Some files could not be precompiled")
+    
+    print("✅ Bytecode precompiled")
+    return True
+
+def emit_pip_cache_key():
+    """Expose the pip cache key to the workflow's actions/cache step via GITHUB_OUTPUT"""
+    if not os.path.exists('requirements.txt'):
+        return None
+    
+    cache_key = f"pip-{requirements_hash()}"
+    
+    github_output = os.getenv('GITHUB_OUTPUT')
+    if github_output:
+        with open(github_output, "a", encoding="utf-8") as f:
+            f.write(f"pip-cache-key={cache_key}\n")
+            f.write(f"pip-cache-path={PIP_CACHE_DIR.as_posix()}\n")
+    
+    print(f"🗄️  pip cache key: {cache_key}")
+    return cache_key
+
+def pyinstaller_cache_dir():
+    """Locate PyInstaller's binary cache for this platform"""
+    if os.getenv('PYINSTALLER_CONFIG_DIR'):
+        return Path(os.environ['PYINSTALLER_CONFIG_DIR'])
+    if PLATFORM_SYSTEM == 'Windows':
+        return Path(os.getenv('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')) / 'pyinstaller'
+    if PLATFORM_SYSTEM == 'Darwin':
+        return Path.home() / 'Library' / 'Application Support' / 'pyinstaller'
+    return Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache')) / 'pyinstaller'
+
+def restore_pyinstaller_cache():
+    """Restore PyInstaller's binary cache from .build_cache"""
+    cache_dir = pyinstaller_cache_dir()
+    if PYINSTALLER_CACHE_BACKUP.exists() and not cache_dir.exists():
+        shutil.copytree(PYINSTALLER_CACHE_BACKUP, cache_dir)
+        print("♻️  Restored PyInstaller cache")
+
+def save_pyinstaller_cache():
+    """Keep PyInstaller's binary cache in .build_cache for the next build"""
+    cache_dir = pyinstaller_cache_dir()
+    if cache_dir.exists():
+        shutil.copytree(cache_dir, PYINSTALLER_CACHE_BACKUP, dirs_exist_ok=True)
+
+def bundled_sources():
+    """Python sources the app bundle is built from - Analysis only checks the
+    entry script's mtime, so a changed import anywhere here must be re-analysed"""
+    return sorted(Path('shadow_core').rglob('*.py')) + [Path(name) for name in APP_MODULES]
+
+def source_hash(paths=None):
+    """Hash the bundled sources so cached analysis only survives unchanged code"""
+    if paths is None:
+        paths = bundled_sources()
+    
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def restore_analysis_cache():
+    """Restore PyInstaller's Analysis TOC and its work files if the sources have not changed"""
+    hash_file = ANALYSIS_CACHE_DIR / "source.hash"
+    if ANALYSIS_TOC.exists() or not hash_file.exists():
+        return
+    if not all((ANALYSIS_CACHE_DIR / name).exists() for name in ANALYSIS_FILES):
+        return
+    if hash_file.read_text() != source_hash():
+        return
+    
+    ANALYSIS_TOC.parent.mkdir(parents=True, exist_ok=True)
+    for name in ANALYSIS_FILES:
+        cached = ANALYSIS_CACHE_DIR / name
+        if cached.is_dir():
+            shutil.copytree(cached, ANALYSIS_TOC.parent / name, dirs_exist_ok=True)
+        else:
+            shutil.copy2(cached, ANALYSIS_TOC.parent / name)
+    print("♻️  Restored PyInstaller analysis")
+
+def save_analysis_cache():
+    """Keep PyInstaller's Analysis TOC and its work files in .build_cache for the next build"""
+    if not all((ANALYSIS_TOC.parent / name).exists() for name in ANALYSIS_FILES):
+        return
+    
+    # Start over, so modules dropped from the build don't linger in localpycs
+    shutil.rmtree(ANALYSIS_CACHE_DIR, ignore_errors=True)
+    ANALYSIS_CACHE_DIR.mkdir(parents=True)
+    for name in ANALYSIS_FILES:
+        source = ANALYSIS_TOC.parent / name
+        if source.is_dir():
+            shutil.copytree(source, ANALYSIS_CACHE_DIR / name)
+        else:
+            shutil.copy2(source, ANALYSIS_CACHE_DIR / name)
+    (ANALYSIS_CACHE_DIR / "source.hash").write_text(source_hash())
+
+def ci_cache_dirs():
+    """Directories persisted between CI runs, keyed by their name in the archive"""
+    return {
+        'pyinstaller': pyinstaller_cache_dir(),
+        'build_cache': BUILD_CACHE_DIR
+    }
+
+def skip_pip_cache(tarinfo):
+    """Leave .build_cache/pip out of the archive - the workflow caches it on its own key"""
+    if Path(tarinfo.name).parts[:2] == ('build_cache', PIP_CACHE_DIR.name):
+        return None
+    return tarinfo
+
+def write_cache_key():
+    """Write the cache key file: requirements hash plus bundled sources hash"""
+    CI_CACHE_KEY_FILE.write_text(f"{requirements_hash()}\n{source_hash()}\n")
+
+def restore_caches():
+    """Unpack the CI cache archive (restored by actions/cache) into place"""
+    write_cache_key()
+    
+    if not CI_CACHE_ARCHIVE.exists():
+        print("ℹ️  No CI cache archive found - starting cold")
+        return True
+    
+    print(f"♻️  Restoring caches from {CI_CACHE_ARCHIVE}...")
+    extract_args = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(CI_CACHE_ARCHIVE, 'rb') as fh:
+                if HAS_ZSTANDARD:
+                    with zstandard.ZstdDecompressor().stream_reader(fh) as reader:
+                        with tarfile.open(fileobj=reader, mode='r|') as tar:
+                            tar.extractall(temp_dir, **extract_args)
+                else:
+                    with tarfile.open(fileobj=fh, mode='r|') as tar:
+                        tar.extractall(temp_dir, **extract_args)
+            
+            for name, target in ci_cache_dirs().items():
+                source = Path(temp_dir) / name
+                if source.exists():
+                    shutil.copytree(source, target, dirs_exist_ok=True)
+        
+        print("✅ Caches restored")
+    except Exception as e:
+        print(f"⚠️  Cache restore warning: {e}")
+    
+    return True
+
+def save_caches():
+    """Pack PyInstaller's cache and .build_cache into one archive for actions/cache"""
+    print(f"🗄️  Saving caches to {CI_CACHE_ARCHIVE}...")
+    
+    try:
+        # cleanup() would do this, but it doesn't run on CI
+        save_analysis_cache()
+        
+        with open(CI_CACHE_ARCHIVE, 'wb') as fh:
+            if HAS_ZSTANDARD:
+                compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                with compressor.stream_writer(fh) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        for name, source in ci_cache_dirs().items():
+                            if source.exists():
+                                tar.add(source, arcname=name, filter=skip_pip_cache)
+            else:
+                with tarfile.open(fileobj=fh, mode='w|') as tar:
+                    for name, source in ci_cache_dirs().items():
+                        if source.exists():
+                            tar.add(source, arcname=name, filter=skip_pip_cache)
+        
+        print("✅ Caches saved")
+    except Exception as e:
+        print(f"⚠️  Cache save warning: {e}")
+    
+    return True
+
+def kill_process_tree(process):
+    """Kill a subprocess together with any children it spawned"""
+    # PyInstaller runs parts of its analysis in helper processes that
+    # would otherwise keep running (and holding files) after a kill
+    if psutil is not None:
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.Error:
+            children = []
+        for child in children:
+            try:
+                child.kill()
+            except psutil.Error:
+                pass
+    elif PLATFORM_SYSTEM == 'Windows':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+    process.kill()
+
+def run_streamed(command, timeout=None, abort_pattern=None, **popen_kwargs):
+    """Run a command echoing its output live; return (returncode, last output lines)"""
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors='replace',
+        bufsize=1,
+        **popen_kwargs
+    )
+    
+    timed_out = threading.Event()
+    def kill_on_timeout():
+        timed_out.set()
+        kill_process_tree(process)
+    
+    timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+    if timer:
+        timer.start()
+    
+    # Keep only the tail for the failure report instead of the whole log
+    tail = deque(maxlen=200)
+    try:
+        for line in process.stdout:
+            sys.stdout.write(f"   {line}")
+            tail.append(line)
+            
+            # Don't wait out the timeout once the build is known to be dead
+            if abort_pattern and abort_pattern.search(line):
+                kill_process_tree(process)
+                process.wait()
+                return process.returncode or 1, f"Aborted on fatal output: {line.strip()}"
+        process.wait()
+    finally:
+        if timer:
+            timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    
+    return process.returncode, ''.join(tail)
+
+def app_pyinstaller_command(release=RELEASE_BUILD):
+    """PyInstaller command line for the Shadow AI GUI application"""
+    # --clean only on request: it wipes the binary cache restored by restore_pyinstaller_cache()
+    command = [
+        sys.executable, '-m', 'PyInstaller',
+        *(['--clean'] if FORCE_CLEAN else []),
+        '--noconfirm',
+        '--noupx',
+        '--onefile' if release else '--onedir',
+        '--windowed',
+        f'--name={APP_NAME}',
+        '--specpath=.',
+        '--workpath', str(WORK_DIR),
+        f'--add-data=shadow_core{os.pathsep}shadow_core',
+        f'--add-data=config.example.py{os.pathsep}.',
+        '--additional-hooks-dir', 'pyinstaller_hooks',
+        *(f'--exclude-module={module}' for module in EXCLUDED_MODULES)
+    ]
+    
+    # Platform-specific icon
+    icon = Path('assets/icon.icns' if PLATFORM_SYSTEM == 'Darwin' else 'assets/icon.ico')
+    if icon.exists():
+        command.append(f'--icon={icon}')
+    
+    command.append('run_shadow_gui.py')
+    return command
+
+def build_gui_application(release=RELEASE_BUILD):
+    """Build the GUI application with PyInstaller"""
+    print(f"🏗️ Building GUI application for {PLATFORM_SYSTEM.lower()}...")
+    
+    try:
+        # Reuse already scanned binaries from previous builds
+        if not FORCE_CLEAN:
+            restore_pyinstaller_cache()
+        
+        # Single executable for releases, folder otherwise
+        pyinstaller_cmd = app_pyinstaller_command(release)
+        
+        # Build from the generated spec while the options are unchanged, so
+        # PyInstaller can reuse its cached Analysis instead of redoing it
+        options_hash = hashlib.sha256('\n'.join(pyinstaller_cmd[1:]).encode()).hexdigest()
+        spec_current = (not FORCE_CLEAN and SPEC_FILE.exists() and SPEC_HASH_FILE.exists()
+                        and SPEC_HASH_FILE.read_text() == options_hash)
+        if spec_current:
+            restore_analysis_cache()
+            pyinstaller_cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm',
+                               '--workpath', str(WORK_DIR), str(SPEC_FILE)]
+        
+        print(f"🔧 Running: {' '.join(pyinstaller_cmd)}")
+        returncode, output = run_streamed(pyinstaller_cmd, timeout=600,
+                                          abort_pattern=FATAL_BUILD_OUTPUT)
+        
+        if returncode == 0:
+            BUILD_CACHE_DIR.mkdir(exist_ok=True)
+            SPEC_HASH_FILE.write_text(options_hash)
+            print("✅ GUI application built successfully")
+            return True
+        else:
+            print(f"❌ Build failed: {output}")
+            return False
+    
+    except subprocess.TimeoutExpired:
+        print("❌ Build timed out after 10 minutes")
+        return False
+    except Exception as e:
+        print(f"❌ Build error: {e}")
+        return False
+
+def run_step(command, description, env=None):
+    """Run a build step"""
+    print(f"\n🔧 {description}")
+    print(f"   Command: {' '.join(command)}")
+    
+    try:
+        returncode, output = run_streamed(command, env=env)
+        if returncode == 0:
+            print("   ✅ Success")
+            return True
+        else:
+            print(f"   ❌ Failed: {output}")
+            return False
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        return False
+
+def pyinstaller_env(index):
+    """Environment with a private PyInstaller cache so parallel builds don't collide"""
+    # Kept in .build_cache, one folder per build slot, so each run starts warm;
+    # a new slot is seeded from the saved binary cache
+    config_dir = PYINSTALLER_PARALLEL_DIR / str(index)
+    if not FORCE_CLEAN and PYINSTALLER_CACHE_BACKUP.exists() and not config_dir.exists():
+        shutil.copytree(PYINSTALLER_CACHE_BACKUP, config_dir)
+    return {**os.environ, 'PYINSTALLER_CONFIG_DIR': str(config_dir.resolve())}
+
+def build_app_and_installer():
+    """Build the application folder and the graphical installer side by side"""
+    builds = [
+        (app_pyinstaller_command(release=False), "Building main application"),
+        ([
+            sys.executable, '-m', 'PyInstaller',
+            '--clean',
+            '--noconfirm',
+            '--onefile',
+            '--windowed',
+            '--name=ShadowAI_Setup',
+            '--icon=assets/icon.ico',
+            'graphical_installer.py'
+        ], "Building graphical installer"),
+    ]
+    
+    # The app build rewrites the spec; don't let the next build reuse it blindly
+    SPEC_HASH_FILE.unlink(missing_ok=True)
+    
+    # Both bundles write to disjoint dist/ and build/ subfolders, so run them together
+    with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+        futures = [
+            executor.submit(run_step, command, description, pyinstaller_env(i))
+            for i, (command, description) in enumerate(builds)
+        ]
+        app_ok, installer_ok = (future.result() for future in futures)
+    
+    if not app_ok:
+        print("\n❌ Main application build failed!")
+        return False
+    
+    if not installer_ok:
+        print("\n⚠️  Installer build failed, but main app is ready")
+    
+    return True
+
+def is_unchanged(src, dst):
+    """Check if dst is a hardlink of src, or a copy with the same size and mtime"""
+    try:
+        if os.path.samefile(src, dst):
+            return True
+        src_stat, dst_stat = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return (src_stat.st_size, int(src_stat.st_mtime)) == (dst_stat.st_size, int(dst_stat.st_mtime))
+
+def clone_or_copy(src, dst):
+    """Copy src to dst as a copy-on-write clone where the filesystem supports it"""
+    if fcntl is not None and sys.platform == 'linux':
+        try:
+            with open(src, 'rb') as src_fh, open(dst, 'wb') as dst_fh:
+                fcntl.ioctl(dst_fh.fileno(), FICLONE, src_fh.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+def copy_if_changed(src, dst):
+    """Copy src to dst unless dst is already up to date"""
+    if is_unchanged(src, dst):
+        return False
+    
+    # Copy next to the target and swap it in, so dst is never half-written
+    temp_dst = f"{dst}.tmp"
+    clone_or_copy(src, temp_dst)
+    os.replace(temp_dst, dst)
+    return True
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a real copy (e.g. across drives)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_if_changed(src, dst)
+
+def deflate_file(path, level):
+    """Read and raw-deflate one file for a zip entry; return (data, crc32, size)"""
+    data = path.read_bytes()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+def write_deflated_entry(zf, path, arcname, deflated):
+    """Append an entry deflated by deflate_file to a ZipFile opened for writing"""
+    data, crc, size = deflated
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(data)
+    zinfo.header_offset = zf.fp.tell()
+    
+    zf.fp.write(zinfo.FileHeader())
+    zf.fp.write(data)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    # close() writes the central directory from filelist at start_dir
+    zf.start_dir = zf.fp.tell()
+
+def create_zip_package(archive_name, root_dir, base_dir=None):
+    """Zip a folder, using fast compression for already-packed binaries"""
+    root_dir = Path(root_dir)
+    source_dir = root_dir / base_dir if base_dir else root_dir
+    archive_path = Path(f"{archive_name}.zip").resolve()
+    
+    # 7-Zip deflates on all cores; the zipfile fallback below does too
+    if SEVEN_ZIP:
+        archive_path.unlink(missing_ok=True)  # 'a' would update the old archive
+        result = subprocess.run(
+            [SEVEN_ZIP, 'a', '-tzip', '-mmt=on', '-mx=5', '-bd', str(archive_path), base_dir or '*'],
+            cwd=root_dir, capture_output=True, text=True
+        )
+        if result.returncode == 0:
+            return str(archive_path)
+        print(f"⚠️  7-Zip failed, falling back to zipfile: {result.stderr.strip()}")
+    
+    # zlib releases the GIL, so entries are deflated on a thread pool and
+    # written in order; the window bounds how many wait in memory
+    workers = os.cpu_count() or 1
+    files = [path for path in sorted(source_dir.rglob('*')) if path.is_file()]
+    with zipfile.ZipFile(archive_path, 'w') as zf, ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for path in files:
+            # PyInstaller output is zlib-packed already; higher levels just burn CPU
+            level = 1 if path.suffix.lower() in PACKED_SUFFIXES else 6
+            pending.append((path, executor.submit(deflate_file, path, level)))
+            if len(pending) >= workers * 2:
+                done_path, deflated = pending.popleft()
+                write_deflated_entry(zf, done_path, done_path.relative_to(root_dir), deflated.result())
+        
+        for done_path, deflated in pending:
+            write_deflated_entry(zf, done_path, done_path.relative_to(root_dir), deflated.result())
+    
+    return str(archive_path)
+
+def write_if_changed(path, content):
+    """Write a text file only if its content changed, so its mtime stays stable"""
+    # Match text-mode newline translation of the platform
+    data = content.replace("\n", os.linesep).encode("utf-8")
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    Path(path).write_bytes(data)
+    return True
+
+def build_manifest(release=RELEASE_BUILD):
+    """Hash the path, size and mtime of every file the build produced"""
+    exe = built_exe(release)
+    files = [exe] if release else sorted(path for path in BUNDLE_DIR.rglob('*') if path.is_file())
+    
+    digest = hashlib.sha256()
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.as_posix()}\0{stat.st_size}\0{int(stat.st_mtime)}\n".encode())
+    return digest.hexdigest()
+
+def stage_build(package_dir, release=RELEASE_BUILD):
+    """Put the built executable (and its --onedir bundle) into package_dir"""
+    package_dir = Path(package_dir)
+    exe = built_exe(release)
+    
+    # A package already holding the current build is refreshed in place. The
+    # whole bundle is compared: a rebuild may change only _internal/
+    manifest_file = BUILD_CACHE_DIR / f"{package_dir.name}.staged"
+    manifest = build_manifest(release) if exe.exists() else None
+    build_current = (package_dir.exists() and manifest_file.exists()
+                     and manifest_file.read_text() == manifest)
+    if package_dir.exists() and not build_current:
+        shutil.rmtree(package_dir)
+    package_dir.mkdir(exist_ok=True)
+    
+    if not exe.exists():
+        print("❌ Executable not found in dist folder")
+        return False
+    
+    if not build_current:
+        if release:
+            link_or_copy(exe, package_dir / EXE_NAME)
+        else:
+            shutil.copytree(BUNDLE_DIR, package_dir, copy_function=link_or_copy, dirs_exist_ok=True)
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        manifest_file.write_text(manifest)
+    return True
+
+def copy_package_files(package_dir, files_to_copy):
+    """Copy (source, destination name) pairs that exist into package_dir"""
+    for src, dst in files_to_copy:
+        if os.path.exists(src):
+            copy_if_changed(src, Path(package_dir) / dst)
+
+def create_distribution_package(release=RELEASE_BUILD):
+    """Create final distribution package"""
+    print("📦 Creating Distribution Package...")
+    
+    try:
+        dist_folder = "ShadowAI_Windows"
+        if not stage_build(dist_folder, release):
+            return False
+        
+        # Create configuration file
+        config_content = '''# Shadow AI Configuration
+# Required: Get your OpenAI API key from https://platform.openai.com/api-keys
+
+OPENAI_API_KEY = "your-openai-api-key-here"
+
+# Optional: Weather API (get from https://openweathermap.org/api)
+OPENWEATHER_API_KEY = "your-weather-api-key-here"
+
+# Note: Replace the placeholder text with your actual API keys
+# The application requires a valid OpenAI API key to function
+'''
+        write_if_changed(f"{dist_folder}/config.py", config_content)
+        
+        # Copy documentation
+        copy_package_files(dist_folder, [('README.md', 'README.md'), ('LICENSE', 'LICENSE')])
+        
+        # Create launcher script - the .bat is a thin wrapper so double-click works
+        launcher_script = '''# Open config.py only while it still holds the placeholder key, then launch
+Set-Location -LiteralPath $PSScriptRoot
+if (Select-String -Quiet -SimpleMatch -Pattern 'your-openai-api-key-here' -Path config.py) {
+    Write-Host 'Add your OpenAI API key to config.py, save it and close Notepad to launch Shadow AI.'
+    Start-Process notepad.exe -ArgumentList config.py -Wait
+}
+Start-Process .\\ShadowAI.exe
+'''
+        write_if_changed(f"{dist_folder}/Launch_ShadowAI.ps1", launcher_script)
+        
+        launcher_content = '''@echo off
+powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0Launch_ShadowAI.ps1"
+'''
+        write_if_changed(f"{dist_folder}/Launch_ShadowAI.bat", launcher_content)
+        
+        # Create ZIP package
+        create_zip_package("ShadowAI_Windows_GUI", dist_folder)
+        
+        print("✅ Distribution package created: ShadowAI_Windows_GUI.zip")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Package creation failed: {e}")
+        return False
+
+def create_ci_package(release=RELEASE_BUILD):
+    """Create the CI distribution package"""
+    print("📦 Creating distribution package...")
+    
+    dist_folder = "ShadowAI-GUI-Windows"
+    
+    try:
+        if not stage_build(dist_folder, release):
+            return False
+        
+        # Copy configuration and docs
+        copy_package_files(dist_folder, [
+            ('config.example.py', 'config.py'),
+            ('README.md', 'README.md'),
+            ('LICENSE', 'LICENSE'),
+            ('requirements.txt', 'requirements.txt')
+        ])
+        
+        # Create simple README
+        readme_content = f"""# Shadow AI - GUI Application
+
+Build Date: {subprocess.getoutput('date /t')}
+Python Version: {PYTHON_VERSION}
+
+## Quick Start
+
+1. Edit config.py with your OpenAI API key
+2. Run ShadowAI.exe
+3. Enjoy your AI assistant!
+
+## Features
+
+- Voice recognition with OpenAI Whisper
+- GPT-4 conversations
+- Text-to-speech responses
+- Weather integration
+- Modern GUI interface
+
+## Configuration
+
+Get your API key from: https://platform.openai.com/api-keys
+Then edit config.py:
+
+OPENAI_API_KEY = "your-api-key-here"
+
+## Support
+
+Visit: https://github.com/{os.getenv('GITHUB_REPOSITORY', 'your-repo')}
+"""
+
+        write_if_changed(f"{dist_folder}/README.txt", readme_content)
+        
+        # Create ZIP package
+        create_zip_package(dist_folder, '.', dist_folder)
+        
+        print(f"✅ Distribution package created: {dist_folder}.zip")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Package creation failed: {e}")
+        return False
+
+def create_installer_package(release=True):
+    """Create installer package with all necessary files"""
+    print("📁 Creating installer package...")
+    
+    package_dir = Path("ShadowAI_Installer_Package")
+    
+    try:
+        if not stage_build(package_dir, release):
+            return False
+        
+        # Copy configuration files - FIXED: Use config.example.py as template
+        copy_package_files(package_dir, [
+            ('config.example.py', 'config.example.py'),  # Keep as example
+            ('README.md', 'README.md'),
+            ('LICENSE', 'LICENSE'),
+            ('requirements.txt', 'requirements.txt')
+        ])
+        
+        # Create a proper config.py with instructions
+        config_content = '''# Shadow AI Configuration
+# Get your OpenAI API key from: https://platform.openai.com/api-keys
+
+OPENAI_API_KEY = "your-openai-api-key-here"
+
+# Optional: Weather API (get from https://openweathermap.org/api)
+OPENWEATHER_API_KEY = "your-weather-api-key-here"
+
+# Optional: Default settings
+DEFAULT_CITY = "London"
+DEFAULT_COUNTRY = "GB"
+
+# Note: Replace the placeholder text with your actual API keys
+# The application will not work without a valid OpenAI API key
+'''
+
+        write_if_changed(package_dir / "config.py", config_content)
+        
+        # Create comprehensive README
+        readme_content = f"""# Shadow AI - GUI Application
+
+## 🚀 Quick Installation Guide
+
+### Portable Version (Recommended)
+1. Extract all files to a folder
+2. Edit `config.py` with your OpenAI API key
+3. Run `ShadowAI.exe` to start the application
+
+### Configuration Steps
+1. Get your OpenAI API key from: https://platform.openai.com/api-keys
+2. Open `config.py` in a text editor
+3. Replace `"your-openai-api-key-here"` with your actual API key
+4. Save the file and run `ShadowAI.exe`
+
+## 🎯 Features
+
+- 🎤 Voice recognition with OpenAI Whisper
+- 🤖 GPT-4 powered conversations
+- 🔊 Text-to-speech responses
+- 🌤️ Live weather updates (optional)
+- 🎨 Modern dark theme GUI
+- 🌍 Multilingual support (English, Urdu, Pashto)
+
+## 🔧 System Requirements
+
+- **OS**: Windows 10/11 (64-bit)
+- **RAM**: 4GB minimum, 8GB recommended
+- **Storage**: 100MB free space
+- **Audio**: Microphone and speakers
+- **Internet**: Required for AI services
+
+## 🆘 Troubleshooting
+
+### Application won't start:
+- Ensure `config.py` has a valid OpenAI API key
+- Check internet connection
+- Run as Administrator if needed
+
+### Voice not working:
+- Check microphone permissions in Windows Settings
+- Ensure microphone is not muted
+- Test microphone with other applications
+
+### No audio output:
+- Check speaker volume
+- Verify default audio output device
+
+## 📄 License
+
+MIT License - See LICENSE file for details.
+
+---
+**Build Date**: {subprocess.getoutput('date /t')}
+**Python Version**: {PYTHON_VERSION}
+"""
+
+        write_if_changed(package_dir / "README.txt", readme_content)
+        
+        # Create configuration helper - the .bat is a thin wrapper so double-click works
+        helper_script = '''# Open config.py only while it still holds the placeholder key, then launch
+Set-Location -LiteralPath $PSScriptRoot
+if (Select-String -Quiet -SimpleMatch -Pattern 'your-openai-api-key-here' -Path config.py) {
+    Write-Host 'Replace your-openai-api-key-here in config.py with your OpenAI API key (https://platform.openai.com/api-keys), save it and close Notepad to launch Shadow AI.'
+    Start-Process notepad.exe -ArgumentList config.py -Wait
+}
+Start-Process .\\ShadowAI.exe
+'''
+        write_if_changed(package_dir / "Configure_And_Run.ps1", helper_script)
+        
+        batch_content = '''@echo off
+powershell -NoProfile -ExecutionPolicy Bypass -File "%~dp0Configure_And_Run.ps1"
+'''
+        write_if_changed(package_dir / "Configure_And_Run.bat", batch_content)
+        
+        # Create ZIP package
+        print("🗜️ Creating ZIP package...")
+        create_zip_package("ShadowAI-GUI-Windows", package_dir)
+        
+        print("✅ Installer package created successfully")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Package creation failed: {e}")
+        return False
+
+def cleanup():
+    """Clean up build artifacts"""
+    print("🧹 Cleaning up...")
+    
+    try:
+        # Keep the analysis, then remove build directories but keep dist
+        save_analysis_cache()
+        shutil.rmtree("build", ignore_errors=True)
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+        
+        # Remove stray .spec files (the app spec is reused by the next build)
+        spec_files = [p for p in Path(".").glob("*.spec") if p.name != SPEC_FILE.name]
+        
+        # Clean __pycache__, without descending into output, VCS or virtualenv trees
+        pycache_dirs = []
+        for root, dirs, _ in os.walk("."):
+            dirs[:] = [d for d in dirs if d not in CLEANUP_SKIP_DIRS]
+            if "__pycache__" in dirs:
+                pycache_dirs.append(Path(root) / "__pycache__")
+                dirs.remove("__pycache__")
+        
+        # Deletes are metadata-bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(lambda path: path.unlink(missing_ok=True), spec_files))
+            list(executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), pycache_dirs))
+        
+        # Persist PyInstaller's binary cache
+        save_pyinstaller_cache()
+        
+        print("✅ Cleanup completed")
+    
+    except Exception as e:
+        print(f"⚠️  Cleanup warning: {e}")
+    
+    return True
+
+async def run_concurrently(*step_functions):
+    """Run independent steps side by side; succeed only if all of them do"""
+    results = await asyncio.gather(*(
+        step() if asyncio.iscoroutinefunction(step) else asyncio.to_thread(step)
+        for step in step_functions
+    ))
+    return all(results)
+
+def mode_pipeline(mode, release=RELEASE_BUILD):
+    """Return (title, steps, generated files, next steps) for a build mode"""
+    if mode == 'onefile':
+        title, steps, generated, usage = mode_pipeline('gui', release=True)
+        return "Windows Single-File Build", steps, generated, usage
+    
+    if mode == 'gui':
+        return (
+            "Windows GUI Build System",
+            [
+                ("Requirements Check", partial(check_requirements, windows_only=True)),
+                ("Dependency Installation", install_dependencies),
+                ("Bytecode Precompile", precompile_bytecode),
+                ("GUI Application Build", partial(build_gui_application, release)),
+                ("Distribution Package", partial(create_distribution_package, release)),
+                ("Cleanup", cleanup)
+            ],
+            [
+                f"{built_exe(release).as_posix()} (Main application)",
+                "ShadowAI_Windows/ (Distribution folder)",
+                "ShadowAI_Windows_GUI.zip (Ready to share)"
+            ],
+            [
+                "Share ShadowAI_Windows_GUI.zip",
+                "Users extract and run Launch_ShadowAI.bat",
+                "Follow configuration guide"
+            ]
+        )
+    
+    if mode == 'installer':
+        return (
+            "GUI Build with Installer",
+            [
+                ("Prerequisites Check", check_requirements),
+                ("GUI Application Build", partial(build_gui_application, True)),
+                ("Installer Package Creation", partial(create_installer_package, True)),
+                ("Cleanup", cleanup)
+            ],
+            [
+                f"{built_exe(True).as_posix()} (Main application)",
+                "ShadowAI-GUI-Windows.zip (Complete package)",
+                "ShadowAI_Installer_Package/ (Installation files)"
+            ],
+            [
+                "Share ShadowAI-GUI-Windows.zip with users",
+                "Users extract and run Configure_And_Run.bat",
+                "Follow the configuration guide"
+            ]
+        )
+    
+    if mode == 'ci':
+        return (
+            "GUI CI Build System",
+            [
+                ("Project Structure Check", partial(check_requirements, extra_files=['README.md'])),
+                ("Cache Restore", restore_caches),
+                ("Dependency Installation", partial(install_dependencies, CI_GUI_DEPENDENCIES)),
+                # Neither needs the other's result, so overlap them
+                ("Import Testing + Bytecode Precompile",
+                 partial(run_concurrently, test_gui_imports, precompile_bytecode)),
+                ("GUI Application Build", partial(build_gui_application, release)),
+                ("Distribution Package", partial(create_ci_package, release)),
+                ("Cache Save", save_caches),
+                # CI workspaces are thrown away with the runner; only clean up locally
+                *([("Cleanup", cleanup)] if CI_ENVIRONMENT == 'Local' else [])
+            ],
+            [
+                f"{built_exe(release).as_posix()} (GUI Application)",
+                "ShadowAI-GUI-Windows.zip (Distribution Package)"
+            ],
+            []
+        )
+    
+    if mode == 'step':
+        return (
+            "Step by Step Build",
+            [("Application and Installer Build", build_app_and_installer)],
+            [
+                f"{BUNDLE_DIR.as_posix()}/ (main application)",
+                "dist/ShadowAI_Setup.exe (installer)"
+            ],
+            []
+        )
+    
+    raise ValueError(f"Unknown build mode: {mode}")
+
+def step_key(step_function):
+    """Identify a step by function and arguments, so shared steps run once"""
+    if isinstance(step_function, partial):
+        return (step_function.func, repr(step_function.args),
+                repr(sorted(step_function.keywords.items())))
+    return (step_function, '()', '[]')
+
+def run_pipeline(steps, completed):
+    """Run build steps in order, skipping ones an earlier mode already ran"""
+    for step_name, step_function in steps:
+        key = step_key(step_function)
+        if key in completed:
+            print(f"\n⏭️  {step_name} (already done)")
+            continue
+        
+        print(f"\n📍 {step_name}")
+        print("-" * 30)
+        
+        result = step_function()
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+        
+        if not result:
+            print(f"❌ {step_name} failed!")
+            return False
+        completed.add(key)
+    
+    return True
+
+def main(mode=None, release=RELEASE_BUILD):
+    """Main build function"""
+    if mode is None:
+        parser = argparse.ArgumentParser(description="Build Shadow AI")
+        parser.add_argument('--mode', action='append',
+                            choices=['gui', 'onefile', 'installer', 'ci', 'step'],
+                            help="build flavour; repeat to build several in one run (default: gui)")
+        parser.add_argument('--release', action='store_true',
+                            help="build a single-file executable")
+        args = parser.parse_args()
+        modes = args.mode or ['gui']
+        release = release or args.release
+    else:
+        modes = [mode] if isinstance(mode, str) else list(mode)
+    
+    # All paths are relative to the project root
+    os.chdir(HERE)
+    
+    print("🚀 Shadow AI - Build System")
+    print("=" * 50)
+    print(f"🏭 Environment: {CI_ENVIRONMENT}")
+    print(f"🐍 Python: {PYTHON_VERSION}")
+    print(f"💻 Platform: {PLATFORM_SYSTEM} {PLATFORM_RELEASE}")
+    print(f"🧩 Modes: {', '.join(modes)}")
+    print()
+    
+    completed = set()
+    for build_mode in modes:
+        title, steps, generated, usage = mode_pipeline(build_mode, release)
+        print(f"\n🏗️ {title}")
+        print("=" * 50)
+        
+        success = run_pipeline(steps, completed)
+        
+        # Result for this mode
+        print("\n" + "=" * 50)
+        if not success:
+            print(f"❌ {title} failed!")
+            sys.exit(1)
+        
+        print(f"🎉 {title} completed successfully!")
+        print()
+        print("📦 Generated Files:")
+        for line in generated:
+            print(f"   - {line}")
+        if usage:
+            print()
+            print("🚀 Distribution Ready:")
+            for number, line in enumerate(usage, 1):
+                print(f"   {number}. {line}")
+
+if __name__ == "__main__":
+    main()
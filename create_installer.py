@@ -4,10 +4,84 @@ Create Windows installer for Shadow AI using Inno Setup
 """
 
 import os
+import functools
 import subprocess
 import sys
 from pathlib import Path
 import shutil
+import string
+
+from build import run_streamed, FATAL_BUILD_OUTPUT
+
+# Uninstall entries Inno Setup 6 and 5 register
+INNO_UNINSTALL_KEYS = [
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 6_is1",
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 5_is1",
+]
+
+# Inno Setup script; raw so Windows paths like \assets keep their backslashes
+INNO_SCRIPT_TEMPLATE = string.Template(r"""; Shadow AI Installer Script
+; Generated automatically
+
+#define MyAppName "Shadow AI"
+#define MyAppVersion "1.0.0"
+#define MyAppPublisher "Shadow AI Team"
+#define MyAppURL "https://github.com/your-repo/shadow-ai"
+#define MyAppExeName "ShadowAI.exe"
+
+[Setup]
+AppId={{A1B2C3D4-E5F6-7890-ABCD-EF1234567890}}
+AppName={#MyAppName}
+AppVersion={#MyAppVersion}
+AppVerName={#MyAppName} {#MyAppVersion}
+AppPublisher={#MyAppPublisher}
+AppPublisherURL={#MyAppURL}
+AppSupportURL={#MyAppURL}
+AppUpdatesURL={#MyAppURL}
+DefaultDirName={autopf}\{#MyAppName}
+DefaultGroupName={#MyAppName}
+AllowNoIcons=yes
+LicenseFile=${current_dir}\LICENSE
+OutputDir=${installer_dir}
+OutputBaseFilename=ShadowAI_Setup
+SetupIconFile=${current_dir}\assets\icon.ico
+Compression=lzma
+SolidCompression=yes
+WizardStyle=modern
+PrivilegesRequired=lowest
+
+[Languages]
+Name: "english"; MessagesFile: "compiler:Default.isl"
+
+[Tasks]
+Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked
+Name: "quicklaunchicon"; Description: "{cm:CreateQuickLaunchIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked; OnlyBelowVersion: 6.1
+
+[Files]
+Source: "${current_dir}\dist\ShadowAI\*"; DestDir: "{app}"; Flags: ignoreversion recursesubdirs createallsubdirs
+Source: "${current_dir}\data\*"; DestDir: "{app}\data"; Flags: ignoreversion recursesubdirs createallsubdirs
+Source: "${current_dir}\assets\*"; DestDir: "{app}\assets"; Flags: ignoreversion recursesubdirs createallsubdirs
+
+[Icons]
+Name: "{group}\{#MyAppName}"; Filename: "{app}\{#MyAppExeName}"
+Name: "{group}\{cm:UninstallProgram,{#MyAppName}}"; Filename: "{uninstallexe}"
+Name: "{autodesktop}\{#MyAppName}"; Filename: "{app}\{#MyAppExeName}"; Tasks: desktopicon
+Name: "{userappdata}\Microsoft\Internet Explorer\Quick Launch\{#MyAppName}"; Filename: "{app}\{#MyAppExeName}"; Tasks: quicklaunchicon
+
+[Run]
+Filename: "{app}\{#MyAppExeName}"; Description: "{cm:LaunchProgram,{#StringChange(MyAppName, '&', '&&')}}"; Flags: nowait postinstall skipifsilent
+
+[Code]
+function InitializeSetup(): Boolean;
+begin
+  Result := True;
+  // Check if .NET Framework is installed (optional)
+  // if not IsDotNetInstalled then begin
+  //   MsgBox('Shadow AI requires .NET Framework 4.5 or later.', mbError, MB_OK);
+  //   Result := False;
+  // end;
+end;
+""")
 
 def create_installer():
     """Create Windows installer package"""
@@ -31,15 +105,15 @@ def create_installer():
     try:
         # Step 1: Build executable with PyInstaller
         print("📦 Building executable with PyInstaller...")
-        result = subprocess.run([
+        returncode, output = run_streamed([
             sys.executable, '-m', 'PyInstaller',
             '--clean',
             '--noconfirm',
             'shadow_ai.spec'
-        ], capture_output=True, text=True, cwd=current_dir)
+        ], timeout=600, abort_pattern=FATAL_BUILD_OUTPUT, cwd=current_dir)
         
-        if result.returncode != 0:
-            print(f"❌ PyInstaller failed: {result.stderr}")
+        if returncode != 0:
+            print(f"❌ PyInstaller failed: {output}")
             return False
         
         print("✅ Executable built successfully!")
@@ -57,25 +131,56 @@ def create_installer():
         # Step 4: Compile installer
         print("🏗️  Compiling installer...")
         iss_file = installer_dir / 'ShadowAI.iss'
-        result = subprocess.run([
+        returncode, output = run_streamed([
             inno_path,
-            iss_file
-        ], capture_output=True, text=True, cwd=installer_dir)
+            str(iss_file)
+        ], cwd=installer_dir)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("🎉 Installer created successfully!")
             print(f"📁 Installer location: {installer_dir}")
             return True
         else:
-            print(f"❌ Inno Setup compilation failed: {result.stderr}")
+            print(f"❌ Inno Setup compilation failed: {output}")
             return False
             
+    except subprocess.TimeoutExpired:
+        print("❌ PyInstaller timed out after 10 minutes")
+        return False
     except Exception as e:
         print(f"❌ Installer creation failed: {e}")
         return False
 
+def inno_setup_from_registry():
+    """Read Inno Setup's install location from its uninstall registry entry"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    
+    # Per-machine or per-user install, from either registry view
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        for key_path in INNO_UNINSTALL_KEYS:
+            for view in (winreg.KEY_WOW64_32KEY, winreg.KEY_WOW64_64KEY):
+                try:
+                    with winreg.OpenKey(hive, key_path, 0, winreg.KEY_READ | view) as key:
+                        location, _ = winreg.QueryValueEx(key, 'InstallLocation')
+                except OSError:
+                    continue
+                
+                iscc = os.path.join(location, 'ISCC.exe')
+                if os.path.exists(iscc):
+                    return iscc
+    return None
+
+@functools.lru_cache(maxsize=1)
 def find_inno_setup():
     """Find Inno Setup compiler path"""
+    # The uninstall entry knows the real location, even for non-default installs
+    iscc = inno_setup_from_registry()
+    if iscc:
+        return iscc
+    
     possible_paths = [
         r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
         r"C:\Program Files\Inno Setup 6\ISCC.exe",
@@ -90,72 +195,11 @@ def find_inno_setup():
 
 def create_inno_script(current_dir, installer_dir):
     """Create Inno Setup script"""
-    iss_content = f"""; Shadow AI Installer Script
-; Generated automatically
-
-#define MyAppName "Shadow AI"
-#define MyAppVersion "1.0.0"
-#define MyAppPublisher "Shadow AI Team"
-#define MyAppURL "https://github.com/your-repo/shadow-ai"
-#define MyAppExeName "ShadowAI.exe"
-
-[Setup]
-AppId={{{{A1B2C3D4-E5F6-7890-ABCD-EF1234567890}}}}
-AppName={{#MyAppName}}
-AppVersion={{#MyAppVersion}}
-AppVerName={{#MyAppName}} {{#MyAppVersion}}
-AppPublisher={{#MyAppPublisher}}
-AppPublisherURL={{#MyAppURL}}
-AppSupportURL={{#MyAppURL}}
-AppUpdatesURL={{#MyAppURL}}
-DefaultDirName={{autopf}}\{{#MyAppName}}
-DefaultGroupName={{#MyAppName}}
-AllowNoIcons=yes
-LicenseFile={current_dir}\LICENSE
-OutputDir={installer_dir}
-OutputBaseFilename=ShadowAI_Setup
-SetupIconFile={current_dir}\assets\icon.ico
-Compression=lzma
-SolidCompression=yes
-WizardStyle=modern
-PrivilegesRequired=lowest
-
-[Languages]
-Name: "english"; MessagesFile: "compiler:Default.isl"
-
-[Tasks]
-Name: "desktopicon"; Description: "{{cm:CreateDesktopIcon}}"; GroupDescription: "{{cm:AdditionalIcons}}"; Flags: unchecked
-Name: "quicklaunchicon"; Description: "{{cm:CreateQuickLaunchIcon}}"; GroupDescription: "{{cm:AdditionalIcons}}"; Flags: unchecked; OnlyBelowVersion: 6.1
-
-[Files]
-Source: "{current_dir}\dist\ShadowAI\*"; DestDir: "{{app}}"; Flags: ignoreversion recursesubdirs createallsubdirs
-Source: "{current_dir}\data\*"; DestDir: "{{app}}\data"; Flags: ignoreversion recursesubdirs createallsubdirs
-Source: "{current_dir}\assets\*"; DestDir: "{{app}}\assets"; Flags: ignoreversion recursesubdirs createallsubdirs
-
-[Icons]
-Name: "{{group}}\{{#MyAppName}}"; Filename: "{{app}}\{{#MyAppExeName}}"
-Name: "{{group}}\{{cm:UninstallProgram,{{#MyAppName}}}}"; Filename: "{{uninstallexe}}"
-Name: "{{autodesktop}}\{{#MyAppName}}"; Filename: "{{app}}\{{#MyAppExeName}}"; Tasks: desktopicon
-Name: "{{userappdata}}\Microsoft\Internet Explorer\Quick Launch\{{#MyAppName}}"; Filename: "{{app}}\{{#MyAppExeName}}"; Tasks: quicklaunchicon
-
-[Run]
-Filename: "{{app}}\{{#MyAppExeName}}"; Description: "{{cm:LaunchProgram,{{#StringChange(MyAppName, '&', '&&')}}}}"; Flags: nowait postinstall skipifsilent
-
-[Code]
-function InitializeSetup(): Boolean;
-begin
-  Result := True;
-  // Check if .NET Framework is installed (optional)
-  // if not IsDotNetInstalled then begin
-  //   MsgBox('Shadow AI requires .NET Framework 4.5 or later.', mbError, MB_OK);
-  //   Result := False;
-  // end;
-end;
-"""
-    
     iss_file = installer_dir / 'ShadowAI.iss'
-    with open(iss_file, 'w', encoding='utf-8') as f:
-        f.write(iss_content)
+    iss_file.write_text(
+        INNO_SCRIPT_TEMPLATE.substitute(current_dir=current_dir, installer_dir=installer_dir),
+        encoding='utf-8'
+    )
     
     print(f"✅ Inno Setup script created: {iss_file}")
 
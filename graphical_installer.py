@@ -4,14 +4,234 @@ Graphical Installer for Shadow AI - Professional installation experience
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import messagebox, filedialog
 import customtkinter as ctk
 import os
 import shutil
 import sys
 from pathlib import Path
 import threading
-import time
+import queue
+import functools
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+# Application folder to install - build.py --mode step puts it next to the installer
+if getattr(sys, 'frozen', False):
+    SOURCE_DIR = Path(sys.executable).resolve().parent / "ShadowAI"
+else:
+    SOURCE_DIR = Path(__file__).resolve().parent / "dist" / "ShadowAI"
+
+# Where the installer suggests installing - Program Files on Windows
+_DEFAULT_INSTALL_ROOT = (
+    os.environ.get('PROGRAMFILES')
+    or os.environ.get('ProgramW6432')
+    or ('/Applications' if sys.platform == 'darwin' else os.path.expanduser('~/.local'))
+)
+
+# Set theme at import - the theme JSON is loaded here, before the window
+# exists, instead of in the middle of building the first widgets
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("blue")
+
+@functools.lru_cache(maxsize=64)
+def _font(size=None, weight=None, family=None):
+    """Shared CTkFont per distinct (size, weight, family) - needs the root window to exist"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+@functools.lru_cache(maxsize=8)
+def _wrap_text(text, width):
+    """Break each line of text at width characters, keeping the existing line breaks"""
+    return "\n".join(textwrap.fill(line, width) for line in text.split("\n"))
+
+class MultithreadedCopier(ThreadPoolExecutor):
+    """Thread pool usable as shutil.copytree's copy_function"""
+    
+    def __init__(self, max_workers=None, copy_function=shutil.copy2):
+        super().__init__(max_workers=max_workers)
+        self.copy_function = copy_function
+        self.futures = []
+        
+    def copy(self, src, dst):
+        """Queue a file copy and return right away, so copytree keeps walking"""
+        self.futures.append(self.submit(self.copy_function, src, dst))
+        return dst
+        
+    def raise_errors(self):
+        """Re-raise the first failed copy, once the pool has drained"""
+        for future in self.futures:
+            future.result()
+
+def replace_file(src, dst):
+    """copy2 that replaces dst first - it may be a hardlink to src from an earlier install"""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    return shutil.copy2(src, dst)
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a real copy (e.g. across drives)"""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def same_filesystem(path, other):
+    """Whether two existing paths live on the same volume"""
+    return os.stat(path).st_dev == os.stat(other).st_dev
+
+def _tree_size(path):
+    """Total size in bytes of the files under path - scandir gets sizes without extra stats on Windows"""
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+def _install_worker(config, status_q):
+    """Install the application off the UI thread, reporting through status_q
+    
+    Messages are ("progress", value, status, detail), ("log", message),
+    ("done",) or ("error", message).
+    """
+    try:
+        status_q.put(("progress", 0.1, "Preparing installation...", ""))
+        status_q.put(("log", "Starting Shadow AI installation..."))
+        
+        # Create installation directory
+        status_q.put(("progress", 0.2, "Creating directories...", ""))
+        install_dir = Path(config["install_path"])
+        install_dir.mkdir(parents=True, exist_ok=True)
+        status_q.put(("log", f"Created installation directory: {install_dir}"))
+        
+        # Copy application files - copy2 releases the GIL during I/O,
+        # so the pool overlaps the per-file latency
+        status_q.put(("progress", 0.2, "Copying application files...", ""))
+        if not SOURCE_DIR.exists():
+            raise FileNotFoundError(f"Application files not found: {SOURCE_DIR}")
+        
+        # On the same volume, hardlinks install the files without moving any data
+        copy_function = replace_file
+        if not config.get("no_hardlinks") and same_filesystem(SOURCE_DIR, install_dir):
+            copy_function = link_or_copy
+            status_q.put(("log", "Installing files as hardlinks (same drive as the installer)"))
+        
+        # Size the tree up front so the bar can follow the bytes copied,
+        # moving from 0.2 to 0.8 and reporting each whole percent once
+        total_bytes = _tree_size(SOURCE_DIR)
+        copied_bytes = 0
+        reported_percent = -1
+        progress_lock = threading.Lock()
+        
+        def copy_with_progress(src, dst):
+            nonlocal copied_bytes, reported_percent
+            copy_function(src, dst)
+            size = os.stat(dst).st_size
+            with progress_lock:
+                copied_bytes += size
+                percent = copied_bytes * 100 // max(total_bytes, 1)
+                if percent == reported_percent:
+                    return dst
+                reported_percent = percent
+                detail = f"{copied_bytes / 2**20:.1f} of {total_bytes / 2**20:.1f} MB"
+            status_q.put(("progress", 0.2 + 0.6 * percent / 100, "Copying application files...", detail))
+            return dst
+        
+        with MultithreadedCopier(max_workers=os.cpu_count() or 4, copy_function=copy_with_progress) as copier:
+            shutil.copytree(SOURCE_DIR, install_dir, copy_function=copier.copy, dirs_exist_ok=True)
+        copier.raise_errors()
+        status_q.put(("log", f"Copied {len(copier.futures)} application files"))
+        
+        # Create shortcuts
+        if config["create_desktop_shortcut"]:
+            status_q.put(("progress", 0.8, "Creating desktop shortcut...", ""))
+            status_q.put(("log", "Created desktop shortcut"))
+            
+        if config["create_start_menu_shortcut"]:
+            status_q.put(("progress", 0.9, "Creating start menu entry...", ""))
+            status_q.put(("log", "Created start menu entry"))
+        
+        # Finalize installation
+        status_q.put(("progress", 1.0, "Installation complete!", ""))
+        status_q.put(("log", "Shadow AI installation completed successfully!"))
+        status_q.put(("done",))
+        
+    except Exception as e:
+        status_q.put(("log", f"Installation error: {str(e)}"))
+        status_q.put(("error", str(e)))
+
+# Shown on the license page
+LICENSE_TEXT = """
+SHADOW AI END USER LICENSE AGREEMENT
+
+1. GRANT OF LICENSE
+This agreement grants you the right to install and use Shadow AI on your personal computer.
+
+2. RESTRICTIONS
+You may not:
+- Reverse engineer, decompile, or disassemble the software
+- Redistribute the software without permission
+- Use the software for illegal purposes
+
+3. PRIVACY
+Shadow AI operates locally on your computer. Your conversations and data remain on your device.
+
+4. DISCLAIMER
+This software is provided "as is" without warranties of any kind.
+
+By clicking "I Agree", you accept the terms of this agreement.
+"""
+
+# Welcome page layout for ShadowAIInstaller._build - each entry is
+# (widget class, options, pack options, children)
+WELCOME_SPEC = (
+    ctk.CTkFrame, {"fg_color": "transparent"}, {"expand": True, "fill": tk.BOTH, "padx": 50, "pady": 50}, (
+        # Logo/Title
+        (ctk.CTkFrame, {"fg_color": "transparent"}, {"pady": (0, 30)}, (
+            (ctk.CTkLabel, {"text": "🤖", "font": {"size": 60}}, {"pady": (0, 10)}, ()),
+            (ctk.CTkLabel, {"text": "Shadow AI", "font": {"size": 32, "weight": "bold"}}, {}, ()),
+            (ctk.CTkLabel, {"text": "Intelligent Multilingual Assistant", "font": {"size": 16}, "text_color": "gray"}, {}, ()),
+        )),
+        # Features
+        (ctk.CTkFrame, {"fg_color": "transparent"}, {"fill": tk.X, "pady": 20}, tuple(
+            (ctk.CTkLabel, {"text": feature, "font": {"size": 14}}, {"anchor": "w", "pady": 2}, ())
+            for feature in (
+                "🎯 Multilingual Support (Urdu, Pashto, English)",
+                "🎤 Voice Recognition & Synthesis",
+                "💬 Natural Language Processing",
+                "🖥️ Computer Automation",
+                "📁 File Management",
+                "🌐 Web Search Integration",
+                "⏰ Smart Reminders",
+                "🔒 Local & Private"
+            )
+        )),
+        # System requirements
+        (ctk.CTkFrame, {}, {"fill": tk.X, "pady": 20}, (
+            (ctk.CTkLabel, {"text": "System Requirements:", "font": {"weight": "bold"}}, {"anchor": "w", "pady": (10, 5)}, ()),
+        ) + tuple(
+            (ctk.CTkLabel, {"text": req}, {"anchor": "w"}, ())
+            for req in (
+                "• Windows 10/11 (64-bit)",
+                "• 4GB RAM minimum, 8GB recommended",
+                "• 500MB free disk space",
+                "• Microphone (for voice features)",
+                "• Internet connection (optional)"
+            )
+        )),
+        # Navigation buttons
+        (ctk.CTkFrame, {"fg_color": "transparent"}, {"fill": tk.X, "pady": (20, 0)}, (
+            (ctk.CTkButton, {"text": "Next >", "command": "next", "width": 120, "height": 35}, {"side": tk.RIGHT}, ()),
+        )),
+    )
+)
 
 class ShadowAIInstaller:
     """Graphical installer for Shadow AI application"""
@@ -21,10 +241,21 @@ class ShadowAIInstaller:
         self.setup_window()
         
         # Installation variables
-        self.install_path = ""
+        self.install_path = os.path.join(_DEFAULT_INSTALL_ROOT, 'Shadow AI')
         self.create_desktop_shortcut = True
         self.create_start_menu_shortcut = True
         self.launch_after_install = True
+        self.license_agreed = False
+        self.no_hardlinks = "--no-hardlinks" in sys.argv[1:]
+        
+        # Status messages from the install worker, applied by _poll_status
+        self._status_q = queue.Queue()
+        self._install_thread = None
+        self._pending_progress = None
+        
+        # The log keeps only the most recent lines
+        self._log_lines = 0
+        self._log_max = 500
         
         # Setup GUI
         self.setup_gui()
@@ -36,10 +267,6 @@ class ShadowAIInstaller:
         self.root.minsize(700, 500)
         self.root.resizable(True, True)
         
-        # Set theme
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-        
         # Center window
         self.center_window()
         
@@ -58,167 +285,133 @@ class ShadowAIInstaller:
         self.main_frame = ctk.CTkFrame(self.root)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        # Create notebook for different pages
-        self.notebook = ttk.Notebook(self.main_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
+        # Tab row - one button per page
+        self.tab_bar = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.tab_bar.pack(fill=tk.X, pady=(0, 10))
+        
+        # Pages share one grid cell and are switched by raising them
+        self.page_area = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.page_area.pack(fill=tk.BOTH, expand=True)
+        self.page_area.grid_rowconfigure(0, weight=1)
+        self.page_area.grid_columnconfigure(0, weight=1)
+        
+        self.pages = {}
+        self.tab_buttons = {}
+        self._current = 0
+        self._tab_after_id = None
+        
+        # Create pages - only the welcome page is filled in now, the
+        # others are built the first time their tab is shown
+        self.welcome_frame = self.add_page("Welcome")
+        self.license_frame = self.add_page("License")
+        self.path_frame = self.add_page("Installation Location")
+        self.components_frame = self.add_page("Components")
+        self.install_frame = self.add_page("Installing")
+        self.finish_frame = self.add_page("Complete")
         
-        # Create pages
         self.create_welcome_page()
-        self.create_license_page()
-        self.create_installation_path_page()
-        self.create_components_page()
-        self.create_installation_page()
-        self.create_finish_page()
+        self._page_builders = {
+            1: self.create_license_page,
+            2: self.create_installation_path_page,
+            3: self.create_components_page,
+            4: self.create_installation_page,
+            5: self.create_finish_page
+        }
         
         # Disable all tabs except first
         self.disable_tabs()
+        self.show_page(0)
+        
+    def add_page(self, title):
+        """Add an empty page and its tab button"""
+        index = len(self.pages)
+        frame = ctk.CTkFrame(self.page_area)
+        frame.grid(row=0, column=0, sticky="nsew")
+        
+        button = ctk.CTkButton(
+            self.tab_bar,
+            text=title,
+            command=lambda: self.select(index),
+            width=100,
+            height=28,
+            fg_color="transparent"
+        )
+        button.pack(side=tk.LEFT, padx=(0, 2))
+        
+        self.pages[index] = frame
+        self.tab_buttons[index] = button
+        return frame
+        
+    def show_page(self, index):
+        """Raise a page and highlight its tab button"""
+        self._current = index
+        self.pages[index].tkraise()
+        for i, button in self.tab_buttons.items():
+            button.configure(
+                fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"] if i == index else "transparent"
+            )
+            
+    def select(self, index):
+        """Switch to a page and run the tab change handling"""
+        self.show_page(index)
+        self.on_tab_changed()
+        
+    def _build(self, parent, spec, commands=None):
+        """Create a widget tree from a WELCOME_SPEC style spec and return its top widget
+        
+        A dict "font" option is passed to _font() and a string "command" is
+        looked up in commands. Children are packed before their parent, so
+        each frame is laid out once.
+        """
+        widget_class, options, pack_options, children = spec
+        options = dict(options)
+        if isinstance(options.get("font"), dict):
+            options["font"] = _font(**options["font"])
+        if isinstance(options.get("command"), str):
+            options["command"] = commands[options["command"]]
+        
+        widget = widget_class(parent, **options)
+        for child in children:
+            self._build(widget, child, commands)
+        widget.pack(**pack_options)
+        return widget
         
     def create_welcome_page(self):
         """Create welcome page"""
-        self.welcome_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(self.welcome_frame, text="Welcome")
-        
-        # Welcome content
-        welcome_content = ctk.CTkFrame(self.welcome_frame, fg_color="transparent")
-        welcome_content.pack(expand=True, fill=tk.BOTH, padx=50, pady=50)
-        
-        # Logo/Title
-        title_frame = ctk.CTkFrame(welcome_content, fg_color="transparent")
-        title_frame.pack(pady=(0, 30))
-        
-        ctk.CTkLabel(
-            title_frame, 
-            text="🤖", 
-            font=ctk.CTkFont(size=60)
-        ).pack(pady=(0, 10))
-        
-        ctk.CTkLabel(
-            title_frame,
-            text="Shadow AI",
-            font=ctk.CTkFont(size=32, weight="bold")
-        ).pack()
-        
-        ctk.CTkLabel(
-            title_frame,
-            text="Intelligent Multilingual Assistant",
-            font=ctk.CTkFont(size=16),
-            text_color="gray"
-        ).pack()
-        
-        # Features
-        features_frame = ctk.CTkFrame(welcome_content, fg_color="transparent")
-        features_frame.pack(fill=tk.X, pady=20)
-        
-        features = [
-            "🎯 Multilingual Support (Urdu, Pashto, English)",
-            "🎤 Voice Recognition & Synthesis", 
-            "💬 Natural Language Processing",
-            "🖥️ Computer Automation",
-            "📁 File Management",
-            "🌐 Web Search Integration",
-            "⏰ Smart Reminders",
-            "🔒 Local & Private"
-        ]
-        
-        for feature in features:
-            feature_frame = ctk.CTkFrame(features_frame, fg_color="transparent")
-            feature_frame.pack(fill=tk.X, pady=2)
-            ctk.CTkLabel(
-                feature_frame, 
-                text=feature,
-                font=ctk.CTkFont(size=14)
-            ).pack(anchor="w")
-        
-        # System requirements
-        req_frame = ctk.CTkFrame(welcome_content)
-        req_frame.pack(fill=tk.X, pady=20)
-        
-        ctk.CTkLabel(
-            req_frame,
-            text="System Requirements:",
-            font=ctk.CTkFont(weight="bold")
-        ).pack(anchor="w", pady=(10, 5))
-        
-        requirements = [
-            "• Windows 10/11 (64-bit)",
-            "• 4GB RAM minimum, 8GB recommended", 
-            "• 500MB free disk space",
-            "• Microphone (for voice features)",
-            "• Internet connection (optional)"
-        ]
-        
-        for req in requirements:
-            ctk.CTkLabel(req_frame, text=req).pack(anchor="w")
-        
-        # Navigation buttons
-        nav_frame = ctk.CTkFrame(welcome_content, fg_color="transparent")
-        nav_frame.pack(fill=tk.X, pady=(20, 0))
-        
-        ctk.CTkButton(
-            nav_frame,
-            text="Next >",
-            command=lambda: self.notebook.select(1),
-            width=120,
-            height=35
-        ).pack(side=tk.RIGHT)
+        self._build(self.welcome_frame, WELCOME_SPEC, commands={"next": lambda: self.select(1)})
         
     def create_license_page(self):
         """Create license agreement page"""
-        self.license_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(self.license_frame, text="License")
-        
         # License content
         license_content = ctk.CTkFrame(self.license_frame, fg_color="transparent")
-        license_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         ctk.CTkLabel(
             license_content,
             text="License Agreement",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(size=20, weight="bold")
         ).pack(anchor="w", pady=(0, 10))
         
-        # License text
-        license_text = """
-SHADOW AI END USER LICENSE AGREEMENT
-
-1. GRANT OF LICENSE
-This agreement grants you the right to install and use Shadow AI on your personal computer.
-
-2. RESTRICTIONS
-You may not:
-- Reverse engineer, decompile, or disassemble the software
-- Redistribute the software without permission
-- Use the software for illegal purposes
-
-3. PRIVACY
-Shadow AI operates locally on your computer. Your conversations and data remain on your device.
-
-4. DISCLAIMER
-This software is provided "as is" without warranties of any kind.
-
-By clicking "I Agree", you accept the terms of this agreement.
-"""
-        
         license_scroll = ctk.CTkScrollableFrame(license_content)
         license_scroll.pack(fill=tk.BOTH, expand=True, pady=10)
         
+        # Wrap once at about 700px worth of average characters; with
+        # wraplength=0 Tk doesn't re-run its wrapping on every resize
+        license_font = _font(size=12)
         license_label = ctk.CTkLabel(
             license_scroll,
-            text=license_text,
-            font=ctk.CTkFont(size=12),
+            text=_wrap_text(LICENSE_TEXT, 700 // license_font.measure("0")),
+            font=license_font,
             justify=tk.LEFT,
-            wraplength=700
+            wraplength=0
         )
         license_label.pack(anchor="w", padx=10, pady=10)
         
         # Agreement checkbox
-        self.agree_var = tk.BooleanVar()
         agree_check = ctk.CTkCheckBox(
             license_content,
-            text="I accept the license agreement",
-            variable=self.agree_var,
-            command=self.on_license_agree
+            text="I accept the license agreement"
         )
+        self.track_checkbox(agree_check, "license_agreed", self.on_license_agree)
         agree_check.pack(anchor="w", pady=10)
         
         # Navigation buttons
@@ -228,7 +421,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkButton(
             nav_frame,
             text="< Back",
-            command=lambda: self.notebook.select(0),
+            command=lambda: self.select(0),
             width=120,
             height=35
         ).pack(side=tk.LEFT)
@@ -236,32 +429,26 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.license_next_btn = ctk.CTkButton(
             nav_frame,
             text="Next >",
-            command=lambda: self.notebook.select(2),
+            command=lambda: self.select(2),
             width=120,
             height=35,
             state="disabled"
         )
         self.license_next_btn.pack(side=tk.RIGHT)
         
+        license_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        
     def create_installation_path_page(self):
         """Create installation path selection page"""
-        self.path_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(self.path_frame, text="Installation Location")
-        
         # Path content
         path_content = ctk.CTkFrame(self.path_frame, fg_color="transparent")
-        path_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         ctk.CTkLabel(
             path_content,
             text="Choose Install Location",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(size=20, weight="bold")
         ).pack(anchor="w", pady=(0, 20))
         
-        # Default installation path
-        default_path = os.path.join(os.environ['PROGRAMFILES'], 'Shadow AI')
-        self.install_path = default_path
-        
         # Path selection frame
         path_selection_frame = ctk.CTkFrame(path_content)
         path_selection_frame.pack(fill=tk.X, pady=10)
@@ -269,7 +456,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkLabel(
             path_selection_frame,
             text="Install Shadow AI to:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         ).pack(anchor="w", pady=(10, 5))
         
         path_input_frame = ctk.CTkFrame(path_selection_frame, fg_color="transparent")
@@ -277,8 +464,8 @@ By clicking "I Agree", you accept the terms of this agreement.
         
         self.path_entry = ctk.CTkEntry(
             path_input_frame,
-            textvariable=tk.StringVar(value=default_path),
-            font=ctk.CTkFont(size=12)
+            textvariable=tk.StringVar(value=self.install_path),
+            font=_font(size=12)
         )
         self.path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
@@ -296,7 +483,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkButton(
             nav_frame,
             text="< Back",
-            command=lambda: self.notebook.select(1),
+            command=lambda: self.select(1),
             width=120,
             height=35
         ).pack(side=tk.LEFT)
@@ -304,24 +491,22 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkButton(
             nav_frame,
             text="Next >",
-            command=lambda: self.notebook.select(3),
+            command=lambda: self.select(3),
             width=120,
             height=35
         ).pack(side=tk.RIGHT)
         
+        path_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        
     def create_components_page(self):
         """Create components selection page"""
-        self.components_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(self.components_frame, text="Components")
-        
         # Components content
         components_content = ctk.CTkFrame(self.components_frame, fg_color="transparent")
-        components_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         ctk.CTkLabel(
             components_content,
             text="Select Components",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(size=20, weight="bold")
         ).pack(anchor="w", pady=(0, 20))
         
         # Components list
@@ -332,7 +517,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkLabel(
             comp_frame,
             text="Required Components:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         ).pack(anchor="w", pady=(10, 5))
         
         required_components = [
@@ -357,25 +542,23 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkLabel(
             comp_frame,
             text="Optional Components:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         ).pack(anchor="w", pady=(20, 5))
         
-        self.create_desktop_var = tk.BooleanVar(value=True)
-        self.create_start_menu_var = tk.BooleanVar(value=True)
-        
         optional_components = [
-            ("Create Desktop Shortcut", self.create_desktop_var),
-            ("Create Start Menu Entry", self.create_start_menu_var),
+            ("Create Desktop Shortcut", "create_desktop_shortcut"),
+            ("Create Start Menu Entry", "create_start_menu_shortcut"),
         ]
         
-        for text, var in optional_components:
-            ctk.CTkCheckBox(
+        for text, attribute in optional_components:
+            checkbox = ctk.CTkCheckBox(
                 comp_frame,
                 text=text,
-                variable=var,
                 checkbox_width=20,
                 checkbox_height=20
-            ).pack(anchor="w", pady=2)
+            )
+            self.track_checkbox(checkbox, attribute)
+            checkbox.pack(anchor="w", pady=2)
         
         # Navigation buttons
         nav_frame = ctk.CTkFrame(components_content, fg_color="transparent")
@@ -384,7 +567,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkButton(
             nav_frame,
             text="< Back",
-            command=lambda: self.notebook.select(2),
+            command=lambda: self.select(2),
             width=120,
             height=35
         ).pack(side=tk.LEFT)
@@ -392,24 +575,22 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkButton(
             nav_frame,
             text="Next >",
-            command=lambda: self.notebook.select(4),
+            command=lambda: self.select(4),
             width=120,
             height=35
         ).pack(side=tk.RIGHT)
         
+        components_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        
     def create_installation_page(self):
         """Create installation progress page"""
-        self.install_frame = ctk.CTkFrame(self.notebook)  # Fixed: CTkFrame
-        self.notebook.add(self.install_frame, text="Installing")
-        
         # Installation content
         install_content = ctk.CTkFrame(self.install_frame, fg_color="transparent")
-        install_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
         ctk.CTkLabel(
             install_content,
             text="Installing Shadow AI",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(size=20, weight="bold")
         ).pack(anchor="w", pady=(0, 20))
         
         # Progress bar
@@ -421,7 +602,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.status_label = ctk.CTkLabel(
             install_content,
             text="Preparing installation...",
-            font=ctk.CTkFont(size=12)
+            font=_font(size=12)
         )
         self.status_label.pack(anchor="w", pady=5)
         
@@ -429,7 +610,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.detail_label = ctk.CTkLabel(
             install_content,
             text="",
-            font=ctk.CTkFont(size=10),
+            font=_font(size=10),
             text_color="gray"
         )
         self.detail_label.pack(anchor="w", pady=2)
@@ -441,13 +622,13 @@ By clicking "I Agree", you accept the terms of this agreement.
         ctk.CTkLabel(
             log_frame,
             text="Installation Log:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         ).pack(anchor="w", pady=(10, 5))
         
         self.log_text = ctk.CTkTextbox(
             log_frame,
             height=150,
-            font=ctk.CTkFont(size=10, family="Consolas")
+            font=_font(size=10, family="Consolas")
         )
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         self.log_text.configure(state="disabled")
@@ -459,7 +640,7 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.install_back_btn = ctk.CTkButton(
             self.install_nav_frame,
             text="< Back",
-            command=lambda: self.notebook.select(3),
+            command=lambda: self.select(3),
             width=120,
             height=35
         )
@@ -467,38 +648,36 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.install_next_btn = ctk.CTkButton(
             self.install_nav_frame,
             text="Next >",
-            command=lambda: self.notebook.select(5),
+            command=lambda: self.select(5),
             width=120,
             height=35,
             state="disabled"
         )
         
+        install_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        
     def create_finish_page(self):
         """Create installation complete page"""
-        self.finish_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(self.finish_frame, text="Complete")
-        
         # Finish content
         finish_content = ctk.CTkFrame(self.finish_frame, fg_color="transparent")
-        finish_content.pack(expand=True, fill=tk.BOTH, padx=50, pady=50)
         
         # Success icon
         ctk.CTkLabel(
             finish_content, 
             text="✅", 
-            font=ctk.CTkFont(size=60)
+            font=_font(size=60)
         ).pack(pady=(0, 20))
         
         ctk.CTkLabel(
             finish_content,
             text="Installation Complete!",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(size=24, weight="bold")
         ).pack(pady=(0, 10))
         
         ctk.CTkLabel(
             finish_content,
             text="Shadow AI has been successfully installed on your computer.",
-            font=ctk.CTkFont(size=14),
+            font=_font(size=14),
             text_color="gray"
         ).pack(pady=(0, 30))
         
@@ -506,13 +685,13 @@ By clicking "I Agree", you accept the terms of this agreement.
         options_frame = ctk.CTkFrame(finish_content)
         options_frame.pack(fill=tk.X, pady=20)
         
-        self.launch_var = tk.BooleanVar(value=True)
-        ctk.CTkCheckBox(
+        launch_check = ctk.CTkCheckBox(
             options_frame,
             text="Launch Shadow AI now",
-            variable=self.launch_var,
-            font=ctk.CTkFont(size=14)
-        ).pack(anchor="w", pady=15)
+            font=_font(size=14)
+        )
+        self.track_checkbox(launch_check, "launch_after_install")
+        launch_check.pack(anchor="w", pady=15)
         
         # Final buttons
         button_frame = ctk.CTkFrame(finish_content, fg_color="transparent")
@@ -528,19 +707,33 @@ By clicking "I Agree", you accept the terms of this agreement.
             hover_color="#3CB371"
         ).pack(side=tk.RIGHT)
         
+        finish_content.pack(expand=True, fill=tk.BOTH, padx=50, pady=50)
+        
+    def track_checkbox(self, checkbox, attribute, callback=None):
+        """Keep a boolean attribute in step with a checkbox, without a Tk variable"""
+        if getattr(self, attribute):
+            checkbox.select()
+        
+        def on_toggle():
+            setattr(self, attribute, bool(checkbox.get()))
+            if callback:
+                callback()
+        
+        checkbox.configure(command=on_toggle)
+        
     def disable_tabs(self):
         """Disable all tabs except the first one"""
-        for i in range(1, self.notebook.index("end")):
-            self.notebook.tab(i, state="disabled")
+        for i in range(1, len(self.pages)):
+            self.tab_buttons[i].configure(state="disabled")
             
     def enable_next_tab(self, current_index):
         """Enable the next tab"""
-        if current_index < self.notebook.index("end") - 1:
-            self.notebook.tab(current_index + 1, state="normal")
+        if current_index < len(self.pages) - 1:
+            self.tab_buttons[current_index + 1].configure(state="normal")
             
     def on_license_agree(self):
         """Enable next button when license is agreed"""
-        if self.agree_var.get():
+        if self.license_agreed:
             self.license_next_btn.configure(state="normal")
         else:
             self.license_next_btn.configure(state="disabled")
@@ -557,20 +750,65 @@ By clicking "I Agree", you accept the terms of this agreement.
             self.install_path = path
             
     def log_message(self, message):
-        """Add message to installation log"""
+        """Add message to installation log, dropping the oldest lines past _log_max"""
         self.log_text.configure(state="normal")
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, message + "\n")
+        self._log_lines += message.count("\n") + 1
+        if self._log_lines > self._log_max:
+            self.log_text.delete("1.0", f"{self._log_lines - self._log_max + 1}.0")
+            self._log_lines = self._log_max
         self.log_text.see(tk.END)
         self.log_text.configure(state="disabled")
-        self.root.update()
+        
+    def _poll_status(self):
+        """Apply status messages from the install worker, then check again shortly"""
+        messages = []
+        while True:
+            try:
+                messages.append(self._status_q.get_nowait())
+            except queue.Empty:
+                break
+        
+        log_lines = []
+        finished = False
+        error = None
+        for kind, *args in messages:
+            if kind == "log":
+                log_lines.append(args[0])
+            elif kind == "progress":
+                self.update_progress(*args)
+            elif kind == "done":
+                finished = True
+                self.install_next_btn.configure(state="normal")
+            elif kind == "error":
+                finished = True
+                error = args[0]
+        
+        # Write the log in one batch rather than a widget update per line
+        if log_lines:
+            self.log_message("\n".join(log_lines))
+            
+        if error:
+            messagebox.showerror("Installation Error", f"Failed to install Shadow AI: {error}")
+        
+        # Keep polling while the installation can still produce output
+        if not finished and (self._install_thread.is_alive() or not self._status_q.empty()):
+            self.root.after(50, self._poll_status)
         
     def update_progress(self, value, status, detail=""):
-        """Update progress bar and status"""
+        """Update progress bar and status - only the latest update before the next idle is drawn"""
+        if self._pending_progress is None:
+            self.root.after_idle(self._apply_progress)
+        self._pending_progress = (value, status, detail)
+        
+    def _apply_progress(self):
+        """Apply the most recent progress update"""
+        value, status, detail = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.set(value)
         self.status_label.configure(text=status)
         if detail:
             self.detail_label.configure(text=detail)
-        self.root.update()
         
     def start_installation(self):
         """Start the installation process"""
@@ -582,50 +820,26 @@ By clicking "I Agree", you accept the terms of this agreement.
         self.install_back_btn.configure(state="disabled")
         
         # Start installation in separate thread
-        thread = threading.Thread(target=self.install_thread)
-        thread.daemon = True
-        thread.start()
-        
-    def install_thread(self):
-        """Installation process in separate thread"""
-        try:
-            self.update_progress(0.1, "Preparing installation...")
-            self.log_message("Starting Shadow AI installation...")
-            
-            # Create installation directory
-            self.update_progress(0.2, "Creating directories...")
-            install_dir = Path(self.install_path)
-            install_dir.mkdir(parents=True, exist_ok=True)
-            self.log_message(f"Created installation directory: {install_dir}")
-            
-            # Simulate file copy
-            self.update_progress(0.6, "Copying application files...")
-            time.sleep(2)
-            self.log_message("Copied core application files")
-            
-            # Create shortcuts
-            if self.create_desktop_var.get():
-                self.update_progress(0.8, "Creating desktop shortcut...")
-                self.log_message("Created desktop shortcut")
-                
-            if self.create_start_menu_var.get():
-                self.update_progress(0.9, "Creating start menu entry...")
-                self.log_message("Created start menu entry")
-            
-            # Finalize installation
-            self.update_progress(1.0, "Installation complete!")
-            self.log_message("Shadow AI installation completed successfully!")
-            
-            # Enable next button
-            self.install_next_btn.configure(state="normal")
-            
-        except Exception as e:
-            self.log_message(f"Installation error: {str(e)}")
-            messagebox.showerror("Installation Error", f"Failed to install Shadow AI: {str(e)}")
+        self._install_thread = threading.Thread(
+            target=_install_worker,
+            args=(self._collect_config(), self._status_q),
+            daemon=True
+        )
+        self._install_thread.start()
+        self._poll_status()
+        
+    def _collect_config(self):
+        """Snapshot the choices the install worker needs"""
+        return {
+            "install_path": self.install_path,
+            "no_hardlinks": self.no_hardlinks,
+            "create_desktop_shortcut": self.create_desktop_shortcut,
+            "create_start_menu_shortcut": self.create_start_menu_shortcut
+        }
             
     def finish_installation(self):
         """Finish installation and optionally launch application"""
-        if self.launch_var.get():
+        if self.launch_after_install:
             messagebox.showinfo(
                 "Shadow AI", 
                 "Installation completed successfully!\n\n"
@@ -636,20 +850,32 @@ By clicking "I Agree", you accept the terms of this agreement.
         
     def run(self):
         """Run the installer"""
-        # Bind tab changes to enable next tabs
-        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self.root.mainloop()
         
-    def on_tab_changed(self, event):
+    def on_tab_changed(self):
         """Handle tab changes"""
-        current_tab = self.notebook.index("current")
+        current_tab = self._current
+        
+        # Build the page the first time it is shown
+        builder = self._page_builders.pop(current_tab, None)
+        if builder:
+            builder()
+        
+        # The rest waits until the user stops switching, so only the
+        # last tab of a quick run of switches is acted on
+        if self._tab_after_id is not None:
+            self.root.after_cancel(self._tab_after_id)
+        self._tab_after_id = self.root.after(80, self._apply_tab_change, current_tab)
+        
+    def _apply_tab_change(self, current_tab):
+        """Enable the next tab and start the installation on its tab"""
+        self._tab_after_id = None
         
         # Enable next tab when moving forward
-        if current_tab < self.notebook.index("end") - 1:
-            self.notebook.tab(current_tab + 1, state="normal")
+        self.enable_next_tab(current_tab)
             
-        # Start installation when reaching installation tab
-        if current_tab == 4:  # Installation tab
+        # Start installation when reaching installation tab, once
+        if current_tab == 4 and self._install_thread is None:
             self.start_installation()
 
 def main():
@@ -1,10 +1,16 @@
 # main.py
 import asyncio
+import atexit
+import hashlib
 import sys
 import threading
 import time
 import os
-from typing import Dict, Optional, Tuple
+import io
+import re
+import wave
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
 
 # Suppress verbose logging
 os.environ['GRPC_VERBOSITY'] = 'ERROR'
@@ -24,6 +30,7 @@ from shadow_core.gui import ShadowGUI
 
 # OpenAI imports
 import openai
+import pyaudio
 from config import OPENAI_API_KEY
 
 # Configure logging - Only show errors, suppress info and httpx logs
@@ -37,8 +44,99 @@ logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-# Configure OpenAI
-openai.api_key = OPENAI_API_KEY
+# Configure OpenAI - one async client for the whole process, so requests
+# share its connection pool instead of each going through a worker thread
+AI = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# One PortAudio context for the process - recording and speech only open
+# streams on it, so device enumeration happens once
+PA = pyaudio.PyAudio()
+atexit.register(PA.terminate)
+
+# Chat model and the fixed start of every conversation - keep the static
+# prompt first and byte-identical so the API can reuse its cached prefix
+CHAT_MODEL = "gpt-4o"
+SYSTEM_PROMPT = "You are Shadow, a helpful AI assistant. Provide clear, concise responses."
+
+# Speech-to-text model - faster and cheaper than whisper-1
+STT_MODEL = "gpt-4o-mini-transcribe"
+
+# Text-to-speech model and voice - alloy, echo, fable, onyx, nova or shimmer
+TTS_MODEL = "tts-1"
+TTS_VOICE = "alloy"
+
+# Memory budget for synthesized speech kept for repeated phrases
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Synthesized speech also persists across runs, least recently used
+# files removed past the budget
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".shadow-ai", "tts-cache")
+TTS_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Speech is requested as response_format="pcm": raw 24 kHz 16-bit mono,
+# which plays without decoding and can start before the download ends
+TTS_SAMPLE_RATE = 24000
+TTS_CHUNK_BYTES = 4096
+
+# End of a sentence in streamed chat output - terminal punctuation, any
+# closing quotes or brackets, then whitespace
+SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+
+
+def pcm_to_wav(audio_data: bytes) -> bytes:
+    """Wrap raw TTS PCM in a WAV header for players that need a container"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(TTS_SAMPLE_RATE)
+        wav.writeframes(audio_data)
+    return buffer.getvalue()
+
+
+def tts_cache_path(text: str) -> str:
+    """Disk cache file for text spoken with the current model and voice"""
+    key = hashlib.sha256(f"{TTS_VOICE}|{TTS_MODEL}|{text}".encode()).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{key}.pcm")
+
+
+def load_cached_speech(text: str) -> Optional[bytes]:
+    """Speech for text from the disk cache, or None"""
+    path = tts_cache_path(text)
+    try:
+        with open(path, "rb") as f:
+            audio_data = f.read()
+        os.utime(path)  # mtime is the last use, for eviction
+    except OSError:
+        return None
+    return audio_data
+
+
+def store_cached_speech(text: str, audio_data: bytes):
+    """Add speech to the disk cache, then trim it to TTS_DISK_CACHE_MAX_BYTES"""
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        path = tts_cache_path(text)
+        # Write aside and rename, so a reader never sees a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(audio_data)
+        os.replace(temp_path, path)
+        
+        entries = []
+        with os.scandir(TTS_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".pcm"):
+                    info = entry.stat()
+                    entries.append((info.st_mtime, info.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, old_path in sorted(entries):
+            if total <= TTS_DISK_CACHE_MAX_BYTES:
+                break
+            os.remove(old_path)
+            total -= size
+    except OSError as e:
+        logger.warning(f"Could not cache speech on disk: {e}")
 
 # ------------------------------
 # Shadow AI Class (OpenAI Only)
@@ -53,20 +151,50 @@ class Shadow:
         # Initialize voice components
         self.voice = ShadowVoice()
         
+        # Recently synthesized speech by text, least recently used first
+        self._tts_cache = OrderedDict()
+        self._tts_cache_bytes = 0
+        # Syntheses in flight by text, so concurrent requests for one phrase share a call
+        self._tts_pending: Dict[str, asyncio.Future] = {}
+        
+        # Speech output, opened on first use and kept open; one utterance at a time
+        self._audio_out = None
+        self._audio_out_failed = False
+        self._speech_lock = asyncio.Lock()
+        
         logger.info("🤖 SHADOW AI - OPENAI GPT-4, WHISPER & TTS ONLINE")
         
-    async def transcribe_audio(self, audio_file_path: str) -> str:
-        """Transcribe audio using Whisper"""
+    async def warmup(self):
+        """Pay one-time costs before the first request - API connection and audio device"""
         try:
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: openai.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        response_format="text"
-                    )
-                )
+            # Any cheap call leaves a connected, TLS-ready socket in the pool
+            await AI.models.list()
+        except Exception as e:
+            logger.warning(f"OpenAI warm-up failed: {e}")
+        
+        async with self._speech_lock:
+            # Opening the device blocks, so keep it off the loop
+            if await asyncio.to_thread(self.output_stream) is None:
+                try:
+                    import pygame
+                    if not pygame.mixer.get_init():
+                        await asyncio.to_thread(pygame.mixer.init)
+                except Exception as e:
+                    logger.warning(f"Audio warm-up failed: {e}")
+        
+    async def transcribe_audio(self, audio: Union[str, io.BytesIO]) -> str:
+        """Transcribe audio using Whisper - a WAV file path or an in-memory WAV"""
+        try:
+            if isinstance(audio, (str, os.PathLike)):
+                with open(audio, "rb") as audio_file:
+                    audio = io.BytesIO(audio_file.read())
+            
+            # The SDK takes (filename, file, content type) - the name tells the API the format
+            transcript = await AI.audio.transcriptions.create(
+                model=STT_MODEL,
+                file=("audio.wav", audio, "audio/wav"),
+                response_format="text"
+            )
             return str(transcript).strip()
         except Exception as e:
             logger.error(f"Whisper transcription failed: {e}")
@@ -75,69 +203,234 @@ class Shadow:
     async def get_gpt4_response(self, prompt: str) -> str:
         """Get response from OpenAI GPT-4"""
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: openai.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": "You are Shadow, a helpful AI assistant. Provide clear, concise responses."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=500,
-                    temperature=0.7
-                )
+            response = await AI.chat.completions.create(
+                model=CHAT_MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=500,
+                temperature=0.7
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"GPT-4 request failed: {e}")
             return "I apologize, but I'm having trouble processing your request right now."
 
+    async def stream_gpt4(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the GPT-4 response a sentence at a time, trailing whitespace included"""
+        buffer = ""
+        replied = False
+        try:
+            stream = await AI.chat.completions.create(
+                model=CHAT_MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=500,
+                temperature=0.7,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer += chunk.choices[0].delta.content or ""
+                while (match := SENTENCE_END.search(buffer)):
+                    replied = True
+                    yield buffer[:match.end()]
+                    buffer = buffer[match.end():]
+        except Exception as e:
+            logger.error(f"GPT-4 request failed: {e}")
+            if not (replied or buffer.strip()):
+                buffer = "I apologize, but I'm having trouble processing your request right now."
+        if buffer.strip():
+            yield buffer
+
+    async def respond(self, prompt: str, gui=None) -> str:
+        """Display and speak the response, starting speech with its first sentence"""
+        pending = asyncio.Queue()
+        speaker = asyncio.create_task(self.speak_sentences(pending))
+        sentences = []
+        speeches = []
+        try:
+            try:
+                async for sentence in self.stream_gpt4(prompt):
+                    sentences.append(sentence)
+                    # Synthesis starts now, overlapping generation and the playback before it
+                    speech = asyncio.create_task(self.synthesize(sentence.strip()))
+                    speeches.append(speech)
+                    pending.put_nowait((sentence.strip(), speech))
+            finally:
+                pending.put_nowait(None)
+            
+            response = "".join(sentences).strip()
+            if gui:
+                gui.write_shadow(f"🤖 Shadow: {response}")
+            else:
+                print(f"🤖 Shadow: {response}")
+            
+            await speaker
+            return response
+        except asyncio.CancelledError:
+            # The speaker and synthesis run as their own tasks - stop them too,
+            # and wait until playback has let go of the output stream
+            for task in (speaker, *speeches):
+                task.cancel()
+            await asyncio.gather(speaker, *speeches, return_exceptions=True)
+            raise
+
     async def speak_text(self, text: str):
         """Speak text using OpenAI TTS - Direct speech without file creation"""
         if not text:
             return
             
         try:
-            # Generate speech using OpenAI TTS
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: openai.audio.speech.create(
-                    model="tts-1",
-                    voice="alloy",  # You can change to: alloy, echo, fable, onyx, nova, shimmer
-                    input=text
-                )
-            )
-            
-            # Get audio data and play directly
-            audio_data = response.content
-            
-            # Play audio directly using pygame
-            await self.play_audio_directly(audio_data)
+            async with self._speech_lock:
+                audio_data = await self.cached_speech(text)
+                stream = self.output_stream()
+                if audio_data is None and stream is not None:
+                    audio_data = await self.stream_speech(text, stream)
+                    self.remember_speech(text, audio_data)
+                    await asyncio.to_thread(store_cached_speech, text, audio_data)
+                else:
+                    if audio_data is None:
+                        audio_data = await self.synthesize(text)
+                    await self.play_speech(audio_data)
                 
         except Exception as e:
             logger.error(f"OpenAI TTS failed: {e}")
             # Fallback to system TTS if available
             self.fallback_tts(text)
 
+    async def speak_sentences(self, pending: asyncio.Queue):
+        """Play queued (sentence, synthesis task) pairs in order until None arrives"""
+        while (item := await pending.get()) is not None:
+            sentence, speech = item
+            try:
+                audio_data = await speech
+                async with self._speech_lock:
+                    await self.play_speech(audio_data)
+            except Exception as e:
+                logger.error(f"OpenAI TTS failed: {e}")
+                self.fallback_tts(sentence)
+
+    async def synthesize(self, text: str) -> bytes:
+        """PCM speech for text - repeated phrases (greetings, error messages) come from the cache"""
+        audio_data = await self.cached_speech(text)
+        if audio_data is not None:
+            return audio_data
+        
+        pending = self._tts_pending.get(text)
+        if pending is None:
+            pending = asyncio.ensure_future(self.fetch_speech(text))
+            self._tts_pending[text] = pending
+            pending.add_done_callback(lambda _: self._tts_pending.pop(text, None))
+        # A cancelled waiter must not cancel the call for the others
+        return await asyncio.shield(pending)
+
+    async def fetch_speech(self, text: str) -> bytes:
+        """Synthesize text as PCM and cache it"""
+        response = await AI.audio.speech.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format="pcm"
+        )
+        self.remember_speech(text, response.content)
+        await asyncio.to_thread(store_cached_speech, text, response.content)
+        return response.content
+
+    async def cached_speech(self, text: str) -> Optional[bytes]:
+        """Speech for text from memory or the disk cache, or None"""
+        audio_data = self._tts_cache.get(text)
+        if audio_data is not None:
+            self._tts_cache.move_to_end(text)
+            return audio_data
+        
+        audio_data = await asyncio.to_thread(load_cached_speech, text)
+        if audio_data is not None:
+            self.remember_speech(text, audio_data)
+        return audio_data
+
+    async def play_speech(self, audio_data: bytes):
+        """Play PCM speech - callers hold _speech_lock"""
+        stream = self.output_stream()
+        if stream is not None:
+            # Sentence-sized writes would hold off cancellation until the end
+            for start in range(0, len(audio_data), TTS_CHUNK_BYTES):
+                await self.write_audio(stream, audio_data[start:start + TTS_CHUNK_BYTES])
+        else:
+            # No PyAudio output - pygame needs a WAV container around the PCM
+            await self.play_audio_directly(pcm_to_wav(audio_data))
+
+    async def stream_speech(self, text: str, stream) -> bytes:
+        """Play speech while it downloads and return the complete PCM audio"""
+        chunks = []
+        async with AI.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format="pcm"
+        ) as response:
+            async for chunk in response.iter_bytes(TTS_CHUNK_BYTES):
+                chunks.append(chunk)
+                await self.write_audio(stream, chunk)
+        return b"".join(chunks)
+
+    async def write_audio(self, stream, chunk: bytes):
+        """Write one chunk to the output stream - a cancelled caller still
+        waits for the write in flight, so the stream is never closed under it"""
+        # write() blocks until the device has room, so keep it off the loop
+        write = asyncio.ensure_future(asyncio.to_thread(stream.write, chunk))
+        try:
+            await asyncio.shield(write)
+        except asyncio.CancelledError:
+            await write
+            raise
+
+    def output_stream(self):
+        """Shared PyAudio output stream for speech, or None if it can't be opened"""
+        if self._audio_out is None and not self._audio_out_failed:
+            try:
+                self._audio_out = PA.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=TTS_SAMPLE_RATE,
+                    output=True
+                )
+            except Exception as e:
+                logger.error(f"Audio output unavailable, using pygame playback: {e}")
+                self._audio_out_failed = True
+        return self._audio_out
+
+    def remember_speech(self, text: str, audio_data: bytes):
+        """Cache synthesized speech, dropping the oldest entries past TTS_CACHE_MAX_BYTES"""
+        if text in self._tts_cache or len(audio_data) > TTS_CACHE_MAX_BYTES:
+            return
+        self._tts_cache[text] = audio_data
+        self._tts_cache_bytes += len(audio_data)
+        while self._tts_cache_bytes > TTS_CACHE_MAX_BYTES:
+            _, evicted = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= len(evicted)
+
     async def play_audio_directly(self, audio_data: bytes):
         """Play audio data directly without saving to file"""
         try:
             import pygame
             import io
             
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            
-            # Create a file-like object from audio data
-            audio_file = io.BytesIO(audio_data)
+            # Initialize pygame mixer - opens the device on first use only,
+            # later calls return straight away and reuse it
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
             
-            # Load and play the audio
-            pygame.mixer.music.load(audio_file)
-            pygame.mixer.music.play()
+            # Decode the whole clip up front so its length is known
+            sound = pygame.mixer.Sound(io.BytesIO(audio_data))
+            sound.play()
             
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                await asyncio.sleep(0.1)
+            # Wait for playback to finish - one wakeup instead of polling get_busy()
+            await asyncio.sleep(sound.get_length())
                 
         except Exception as e:
             logger.error(f"Direct audio playback failed: {e}")
@@ -148,7 +441,7 @@ class Shadow:
         """Fallback method to play audio via temporary file"""
         try:
             import tempfile
-            temp_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+            temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
             temp_file.write(audio_data)
             temp_file.close()
             
@@ -161,14 +454,24 @@ class Shadow:
             logger.error(f"Fallback audio playback failed: {e}")
 
     async def play_audio_file(self, audio_file: str):
-        """Play audio file using platform-specific player"""
+        """Play a WAV file using platform-specific player - no shell, and the loop keeps running"""
         try:
             if sys.platform == "win32":
-                os.system(f"start wmplayer {audio_file} 2>nul")
+                # PowerShell string literal - a quote is escaped by doubling it
+                quoted = audio_file.replace("'", "''")
+                command = ["powershell", "-NoProfile", "-Command",
+                           f"(New-Object Media.SoundPlayer '{quoted}').PlaySync()"]
             elif sys.platform == "darwin":  # macOS
-                os.system(f"afplay {audio_file} 2>/dev/null")
+                command = ["afplay", audio_file]
             else:  # Linux
-                os.system(f"mpv {audio_file} --no-video --quiet 2>/dev/null")
+                command = ["mpv", "--no-video", "--really-quiet", audio_file]
+            
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            await process.wait()
         except Exception as e:
             logger.error(f"Audio playback failed: {e}")
 
@@ -183,13 +486,13 @@ class Shadow:
             logger.error(f"Fallback TTS also failed: {e}")
             print(f"🤖 [Text Response]: {text}")
 
-    async def process_voice_input(self, audio_file_path: str, gui=None) -> str:
+    async def process_voice_input(self, audio: Union[str, io.BytesIO], gui=None) -> str:
         """Process voice input and return response"""
         # Step 1: Transcribe audio with Whisper
         if gui:
             gui.write_shadow("🎤 Transcribing speech...")
         
-        transcribed_text = await self.transcribe_audio(audio_file_path)
+        transcribed_text = await self.transcribe_audio(audio)
         
         if not transcribed_text:
             error_msg = "Sorry, I couldn't understand the audio."
@@ -207,18 +510,8 @@ class Shadow:
         if gui:
             gui.write_shadow("🤖 Thinking...")
         
-        response = await self.get_gpt4_response(transcribed_text)
-        
         # Step 3: Display and speak response
-        if gui:
-            gui.write_shadow(f"🤖 Shadow: {response}")
-        else:
-            print(f"🤖 Shadow: {response}")
-        
-        # Speak the response
-        await self.speak_text(response)
-        
-        return response
+        return await self.respond(transcribed_text, gui)
 
     async def process_text_input(self, text: str, gui=None) -> str:
         """Process text input and return response"""
@@ -234,21 +527,23 @@ class Shadow:
         else:
             print(f"👤 User: {text}")
         
-        response = await self.get_gpt4_response(text)
-        
-        if gui:
-            gui.write_shadow(f"🤖 Shadow: {response}")
-        else:
-            print(f"🤖 Shadow: {response}")
-        
-        # Speak the response
-        await self.speak_text(response)
-        
-        return response
+        return await self.respond(text, gui)
 
     async def shutdown(self):
-        """Clean shutdown"""
+        """Clean shutdown - run it on BG_LOOP, where the client's connections live"""
         logger.info("Shutting down Shadow AI...")
+        await AI.close()
+        # Playback writes under the lock - PortAudio can't close a stream mid-write
+        async with self._speech_lock:
+            if self._audio_out is not None:
+                self._audio_out.stop_stream()
+                self._audio_out.close()
+                self._audio_out = None
+        
+        # Release the audio device if the pygame fallback opened it
+        pygame = sys.modules.get("pygame")
+        if pygame and pygame.mixer.get_init():
+            pygame.mixer.quit()
 
 # ------------------------------
 # Global Shadow Instance
@@ -267,37 +562,70 @@ _bg_thread = threading.Thread(target=start_background_loop, args=(BG_LOOP,), dae
 _bg_thread.start()
 time.sleep(0.05)
 
+# Starts while the user is still typing or speaking the first request
+asyncio.run_coroutine_threadsafe(SHADOW.warmup(), BG_LOOP)
+
 # ------------------------------
 # Voice Recording Function (Auto-stop version)
 # ------------------------------
-import pyaudio
-import wave
 import threading
 
+# Voice activity detection - optional, falls back to an amplitude threshold
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+RECORD_RATE = 16000
+VAD_FRAME_BYTES = RECORD_RATE * 20 // 1000 * 2  # 20 ms of int16 samples
+
 class VoiceRecorder:
     """Voice recorder with auto-stop functionality"""
     
     def __init__(self):
-        self.audio = pyaudio.PyAudio()
-        self.frames = []
+        self.audio = PA
+        self.wav_buffer = None
+        self.wav = None
         self.is_recording = False
         self.stream = None
         self.silence_threshold = 500  # Adjust based on microphone sensitivity
         self.silence_duration = 2.0   # Stop after 2 seconds of silence
         self.last_sound_time = None
+        
+        # With VAD, stop 0.5s after speech instead - once at least 100ms of
+        # it has been heard, so a click doesn't count as an utterance
+        self.vad = webrtcvad.Vad(3) if webrtcvad else None
+        self.speech_silence_duration = 0.5
+        self.speech_onset_frames = 5
+        self.voiced_frames = 0
+        self.loop = None
+        self.done = None
     
     def start_recording(self):
         """Start recording audio with auto-stop"""
-        self.frames = []
         self.is_recording = True
         self.last_sound_time = time.time()
+        self.voiced_frames = 0
+        
+        # Set from the silence thread when recording auto-stops; must be
+        # called on the event loop that awaits it
+        self.loop = asyncio.get_running_loop()
+        self.done = asyncio.Event()
+        
+        # Encode the WAV in memory as audio arrives, so it is complete the
+        # moment recording stops instead of being assembled afterwards
+        self.wav_buffer = io.BytesIO()
+        self.wav = wave.open(self.wav_buffer, 'wb')
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
+        self.wav.setframerate(RECORD_RATE)
         
         self.stream = self.audio.open(
             format=pyaudio.paInt16,
             channels=1,
-            rate=16000,
+            rate=RECORD_RATE,
             input=True,
-            frames_per_buffer=1024,
+            frames_per_buffer=960,  # 60 ms - three whole VAD frames
             stream_callback=self.callback
         )
         
@@ -310,47 +638,58 @@ class VoiceRecorder:
     def _detect_silence(self):
         """Detect silence and auto-stop recording"""
         while self.is_recording:
-            if time.time() - self.last_sound_time > self.silence_duration:
+            limit = self.silence_duration
+            if self.vad and self.heard_speech():
+                limit = self.speech_silence_duration
+            if time.time() - self.last_sound_time > limit:
                 self.is_recording = False
+                self.loop.call_soon_threadsafe(self.done.set)
                 break
             time.sleep(0.1)
     
-    def stop_recording(self) -> str:
-        """Stop recording and save to file"""
+    def heard_speech(self) -> bool:
+        """Whether the recording holds speech - always assumed without VAD"""
+        return not self.vad or self.voiced_frames >= self.speech_onset_frames
+    
+    def stop_recording(self) -> io.BytesIO:
+        """Stop recording and return the WAV, ready to upload"""
         self.is_recording = False
         
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
         
-        # Save to file
-        filename = f"temp_audio_{int(time.time())}.wav"
-        wf = wave.open(filename, 'wb')
-        wf.setnchannels(1)
-        wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-        wf.setframerate(16000)
-        wf.writeframes(b''.join(self.frames))
-        wf.close()
+        # Finish the WAV header (frame count) - the samples are already written
+        self.wav.close()
+        self.wav_buffer.seek(0)
         
-        return filename
+        return self.wav_buffer
     
     def callback(self, in_data, frame_count, time_info, status):
         """Audio callback with silence detection"""
         if self.is_recording:
-            self.frames.append(in_data)
-            
-            # Check for sound (simple amplitude-based detection)
-            audio_data = np.frombuffer(in_data, dtype=np.int16)
-            max_amplitude = np.max(np.abs(audio_data))
+            self.wav.writeframesraw(in_data)
             
-            if max_amplitude > self.silence_threshold:
-                self.last_sound_time = time.time()
+            if self.vad:
+                for start in range(0, len(in_data) - VAD_FRAME_BYTES + 1, VAD_FRAME_BYTES):
+                    if self.vad.is_speech(in_data[start:start + VAD_FRAME_BYTES], RECORD_RATE):
+                        self.voiced_frames += 1
+                        self.last_sound_time = time.time()
+            else:
+                # Check for sound (simple amplitude-based detection) - max/min
+                # scan the int16 samples in C without copying the buffer
+                samples = memoryview(in_data).cast('h')
+                if samples and max(max(samples), -min(samples)) > self.silence_threshold:
+                    self.last_sound_time = time.time()
         
         return (in_data, pyaudio.paContinue)
     
     def cleanup(self):
-        """Cleanup resources"""
-        self.audio.terminate()
+        """Cleanup resources - PA itself stays open for the next recording"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
 
 # ------------------------------
 # Query Handlers
@@ -369,26 +708,31 @@ async def handle_voice_input(gui=None):
         recorder.start_recording()
         
         # Wait for auto-stop (max 10 seconds)
-        start_time = time.time()
-        while recorder.is_recording and (time.time() - start_time) < 10:
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(recorder.done.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            pass
         
         # Stop recording
-        audio_file = recorder.stop_recording()
+        audio = recorder.stop_recording()
+        
+        if not recorder.heard_speech():
+            # Nothing but silence - don't pay for transcribing it
+            error_msg = "Sorry, I didn't hear anything."
+            if gui:
+                gui.write_shadow(error_msg)
+            else:
+                print(error_msg)
+            await SHADOW.speak_text(error_msg)
+            return
         
         if gui:
             gui.write_shadow("✅ Audio recorded, processing...")
         else:
             print("✅ Processing...")
         
-        # Process the audio
-        await SHADOW.process_voice_input(audio_file, gui)
-        
-        # Clean up temp file
-        try:
-            os.remove(audio_file)
-        except:
-            pass
+        # Process the audio - uploaded straight from memory
+        await SHADOW.process_voice_input(audio, gui)
             
     except Exception as e:
         error_msg = f"Error processing voice input: {e}"
@@ -414,6 +758,15 @@ def run_cli_mode():
     print("🎤 Voice: Auto-stops when you stop speaking")
     print("=" * 60)
 
+    # Typed turns run on BG_LOOP while the next prompt is read, so a reply
+    # can still be speaking when the user starts typing again
+    turns = set()
+
+    def turn_done(turn):
+        turns.discard(turn)
+        if not turn.cancelled() and turn.exception():
+            print(f"\n❌ Error: {turn.exception()}")
+
     while True:
         try:
             user_input = input("\nYou: ").strip()
@@ -423,19 +776,19 @@ def run_cli_mode():
             
             if user_input.lower() in ("exit", "quit"):
                 print("👋 Goodbye!")
-                asyncio.run_coroutine_threadsafe(SHADOW.shutdown(), BG_LOOP)
+                for turn in list(turns):
+                    turn.cancel()
                 break
             
             if user_input.lower() == "voice":
-                # Handle voice input with auto-stop
+                # Handle voice input with auto-stop - one recording at a time
                 asyncio.run_coroutine_threadsafe(handle_voice_input(), BG_LOOP).result(timeout=60)
                 continue
             
             # Handle text input
-            response = asyncio.run_coroutine_threadsafe(
-                handle_text_input(user_input), 
-                BG_LOOP
-            ).result(timeout=60)
+            turn = asyncio.run_coroutine_threadsafe(handle_text_input(user_input), BG_LOOP)
+            turns.add(turn)
+            turn.add_done_callback(turn_done)
             
         except KeyboardInterrupt:
             print("\n\n🛑 Interrupted. Type 'exit' to quit.")
@@ -485,14 +838,11 @@ async def main():
         logger.error(f"Fatal error in main: {e}")
         print(f"❌ Fatal error: {e}")
     finally:
-        await SHADOW.shutdown()
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(SHADOW.shutdown(), BG_LOOP))
 
 # ------------------------------
 # Entry Point
 # ------------------------------
 if __name__ == "__main__":
-    # Import numpy for silence detection
-    import numpy as np
-    
     # Run the main async function
     asyncio.run(main())
\ No newline at end of file
@@ -6,14 +6,26 @@ Minimal installer for Shadow AI - Fast and efficient
 import tkinter as tk
 from tkinter import ttk, messagebox
 import customtkinter as ctk
+import compileall
 import os
 import shutil
 import sys
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import webbrowser
 
+def write_atomic(path: Path, content: str):
+    """Write a text file in one go and move it into place, so it is never left truncated"""
+    temp_path = path.with_name(path.name + ".tmp")
+    # Text mode, so the .bat launcher gets the platform's line endings
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
 class MinimalInstaller:
     """Minimal installer for Shadow AI"""
     
@@ -172,20 +184,33 @@ class MinimalInstaller:
                 "LICENSE"
             ]
             
-            for file in files_to_copy:
-                source = current_dir / file
-                if source.exists():
-                    shutil.copy2(source, self.install_dir / file)
-            
-            self.update_progress(40, "Creating application structure...")
-            
-            # Copy shadow_core directory
-            shadow_core_src = current_dir / "shadow_core"
-            shadow_core_dest = self.install_dir / "shadow_core"
-            if shadow_core_src.exists():
-                if shadow_core_dest.exists():
-                    shutil.rmtree(shadow_core_dest)
-                shutil.copytree(shadow_core_src, shadow_core_dest)
+            # Files are small and independent, so copy several at once;
+            # copy2 itself already uses the OS fast path (sendfile/CopyFile)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                copies = []
+                
+                def copy_in_pool(source, dest):
+                    copies.append(pool.submit(shutil.copy2, source, dest))
+                
+                for file in files_to_copy:
+                    source = current_dir / file
+                    if source.exists():
+                        copy_in_pool(source, self.install_dir / file)
+                
+                self.update_progress(40, "Creating application structure...")
+                
+                # Copy shadow_core directory - copytree makes the directories
+                # here and hands each file to the pool
+                shadow_core_src = current_dir / "shadow_core"
+                shadow_core_dest = self.install_dir / "shadow_core"
+                if shadow_core_src.exists():
+                    if shadow_core_dest.exists():
+                        shutil.rmtree(shadow_core_dest)
+                    shutil.copytree(shadow_core_src, shadow_core_dest, copy_function=copy_in_pool)
+                
+                # Re-raise the first failed copy, if any
+                for copy in copies:
+                    copy.result()
             
             self.update_progress(60, "Creating configuration...")
             
@@ -211,7 +236,7 @@ cd /d "{self.install_dir}"
 python run_shadow_gui.py
 pause
 '''
-            (self.install_dir / "Start Shadow AI.bat").write_text(batch_content, encoding='utf-8')
+            write_atomic(self.install_dir / "Start Shadow AI.bat", batch_content)
             
             # Create Python launcher script
             launcher_content = '''#!/usr/bin/env python3
@@ -265,7 +290,14 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-            (self.install_dir / "launcher.py").write_text(launcher_content)
+            write_atomic(self.install_dir / "launcher.py", launcher_content)
+            
+            self.update_progress(90, "Compiling Python files...")
+            
+            # Write the .pyc files now so the first launch only has to load them.
+            # A frozen installer can't fork compile workers, so compile in-process there
+            workers = 1 if getattr(sys, 'frozen', False) else 0
+            compileall.compile_dir(str(self.install_dir), quiet=1, workers=workers)
             
             self.update_progress(100, "Installation complete!")
             
@@ -0,0 +1,8 @@
+# hook-customtkinter.py
+"""
+PyInstaller hook for customtkinter - bundle its theme JSON and image assets
+"""
+
+from PyInstaller.utils.hooks import collect_data_files
+
+datas = collect_data_files('customtkinter')
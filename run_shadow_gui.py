@@ -2,13 +2,15 @@
 import sys
 import os
 import asyncio
+import json
+import queue
 import threading
 import time
 import pyaudio
 import wave
-import numpy as np
 import tempfile
 import requests
+from collections import OrderedDict
 from datetime import datetime
 
 # Add the project root to Python path
@@ -17,7 +19,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Import the actual GUI from shadow_core
 try:
     from shadow_core.gui import ShadowGUI
-    from main import SHADOW, BG_LOOP
+    from main import SHADOW, BG_LOOP, PA
     GUI_AVAILABLE = True
 except ImportError as e:
     print(f"❌ Failed to import required modules: {e}")
@@ -26,6 +28,31 @@ except ImportError as e:
     print("   - main.py with SHADOW and BG_LOOP")
     GUI_AVAILABLE = False
 
+# OpenWeather responses persist across runs, keyed by lowercased "city,country"
+WEATHER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".shadow-ai", "weather-cache.json")
+
+# OpenWeather icon codes - two digits for the condition, d/n for day/night
+WEATHER_ICONS = {
+    '01d': '☀️',  # clear sky day
+    '01n': '🌙',  # clear sky night
+    '02d': '⛅',  # few clouds day
+    '02n': '☁️',  # few clouds night
+    '03d': '☁️',  # scattered clouds
+    '03n': '☁️',
+    '04d': '☁️',  # broken clouds
+    '04n': '☁️',
+    '09d': '🌧️',  # shower rain
+    '09n': '🌧️',
+    '10d': '🌦️',  # rain day
+    '10n': '🌧️',  # rain night
+    '11d': '⛈️',  # thunderstorm
+    '11n': '⛈️',
+    '13d': '❄️',  # snow
+    '13n': '❄️',
+    '50d': '🌫️',  # mist
+    '50n': '🌫️'
+}
+
 class WeatherService:
     """OpenWeather API service for weather data"""
     
@@ -34,12 +61,73 @@ class WeatherService:
         self.base_url = "http://api.openweathermap.org/data/2.5"
         self.last_update = None
         self.cache_duration = 600  # 10 minutes cache
+        self.cache_size = 64       # cities kept, least recently used dropped first
+        self._disk_cache = self._load_disk_cache()
+        
+        # Parsed results by cache key as (time.monotonic() of the fetch, weather).
+        # The background refresh and user queries call in from different
+        # threads; the lock guards both caches but is never held across a
+        # request, so one slow fetch doesn't stall every other caller
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _load_disk_cache(self):
+        """Cached responses from earlier runs, or an empty cache"""
+        try:
+            with open(WEATHER_CACHE_FILE, encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return OrderedDict()
+    
+    def _save_disk_cache(self):
+        """Write the cache aside and rename it, so a crash can't leave half a file"""
+        try:
+            os.makedirs(os.path.dirname(WEATHER_CACHE_FILE), exist_ok=True)
+            temp_file = f"{WEATHER_CACHE_FILE}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._disk_cache, f)
+            os.replace(temp_file, WEATHER_CACHE_FILE)
+        except OSError as e:
+            print(f"Weather cache not saved: {e}")
         
     def get_weather(self, city="London", country_code="GB"):
-        """Get current weather data"""
+        """Get current weather data - at most one request per city per cache_duration"""
+        if not self.api_key:
+            return {"error": "OpenWeather API key not configured"}
+        
+        key = f"{city},{country_code}".lower()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.cache_duration:
+                self._cache.move_to_end(key)
+                if key in self._disk_cache:
+                    self._disk_cache.move_to_end(key)
+                return cached[1]
+        
+        weather_info, fetched = self._fetch_weather(key, city, country_code)
+        if 'error' not in weather_info:
+            # Date it from the fetch, which may have been an earlier run
+            age = max(0.0, time.time() - fetched)
+            with self._lock:
+                self._cache[key] = (time.monotonic() - age, weather_info)
+                self._remember(self._cache, key)
+        return weather_info
+    
+    def _remember(self, cache, key):
+        """Mark key as most recently used, evicting past cache_size"""
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _fetch_weather(self, key, city, country_code):
+        """Weather from the disk cache while fresh, otherwise from the API,
+        with the time it was fetched"""
         try:
-            if not self.api_key:
-                return {"error": "OpenWeather API key not configured"}
+            with self._lock:
+                entry = self._disk_cache.get(key)
+                if entry and time.time() - entry['fetched'] < self.cache_duration:
+                    self._disk_cache.move_to_end(key)
+                    return self._weather_info(entry), entry['fetched']
             
             # Construct API URL
             url = f"{self.base_url}/weather"
@@ -50,57 +138,65 @@ class WeatherService:
                 'lang': 'en'
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            # Revalidate an expired entry - unchanged data comes back as an empty 304
+            headers = {}
+            if entry and entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry and entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
             
-            data = response.json()
+            try:
+                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response.raise_for_status()
+            except requests.exceptions.RequestException:
+                # Stale weather beats none while the network is down
+                if entry:
+                    return self._weather_info(entry), entry['fetched']
+                raise
             
-            # Extract relevant information
-            weather_info = {
-                'city': data['name'],
-                'country': data['sys']['country'],
-                'temperature': round(data['main']['temp']),
-                'feels_like': round(data['main']['feels_like']),
-                'humidity': data['main']['humidity'],
-                'description': data['weather'][0]['description'].title(),
-                'icon': data['weather'][0]['icon'],
-                'wind_speed': data['wind']['speed'],
-                'updated': datetime.now().strftime("%H:%M")
-            }
+            if entry and response.status_code == 304:
+                entry = dict(entry, fetched=time.time())
+            else:
+                entry = {
+                    'fetched': time.time(),
+                    'data': response.json(),
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+            weather_info = self._weather_info(entry)
+            with self._lock:
+                self._disk_cache[key] = entry
+                self._remember(self._disk_cache, key)
+                self._save_disk_cache()
             
-            self.last_update = time.time()
-            return weather_info
+            self.last_update = entry['fetched']
+            return weather_info, entry['fetched']
             
         except requests.exceptions.RequestException as e:
-            return {"error": f"Weather API error: {str(e)}"}
+            return {"error": f"Weather API error: {str(e)}"}, None
         except KeyError as e:
-            return {"error": f"Invalid weather data format: {str(e)}"}
+            return {"error": f"Invalid weather data format: {str(e)}"}, None
         except Exception as e:
-            return {"error": f"Weather service error: {str(e)}"}
+            return {"error": f"Weather service error: {str(e)}"}, None
+    
+    def _weather_info(self, entry):
+        """Extract the displayed fields from a cached API response"""
+        data = entry['data']
+        return {
+            'city': data['name'],
+            'country': data['sys']['country'],
+            'temperature': round(data['main']['temp']),
+            'feels_like': round(data['main']['feels_like']),
+            'humidity': data['main']['humidity'],
+            'description': data['weather'][0]['description'].title(),
+            'icon': data['weather'][0]['icon'],
+            'wind_speed': data['wind']['speed'],
+            'updated': datetime.fromtimestamp(entry['fetched']).strftime("%H:%M")
+        }
     
     def get_weather_icon(self, icon_code):
         """Convert OpenWeather icon code to emoji"""
-        icon_map = {
-            '01d': '☀️',  # clear sky day
-            '01n': '🌙',  # clear sky night
-            '02d': '⛅',  # few clouds day
-            '02n': '☁️',  # few clouds night
-            '03d': '☁️',  # scattered clouds
-            '03n': '☁️',
-            '04d': '☁️',  # broken clouds
-            '04n': '☁️',
-            '09d': '🌧️',  # shower rain
-            '09n': '🌧️',
-            '10d': '🌦️',  # rain day
-            '10n': '🌧️',  # rain night
-            '11d': '⛈️',  # thunderstorm
-            '11n': '⛈️',
-            '13d': '❄️',  # snow
-            '13n': '❄️',
-            '50d': '🌫️',  # mist
-            '50n': '🌫️'
-        }
-        return icon_map.get(icon_code, '🌈')
+        return WEATHER_ICONS.get(icon_code, '🌈')
     
     def format_weather_text(self, weather_data):
         """Format weather data for display"""
@@ -122,8 +218,11 @@ class VoiceRecorder:
     """Voice recorder with auto-stop functionality"""
     
     def __init__(self):
-        self.audio = pyaudio.PyAudio()
-        self.frames = []
+        self.audio = PA
+        self.frames = None
+        self.filename = None
+        self.wav = None
+        self.writer_thread = None
         self.is_recording = False
         self.stream = None
         self.silence_threshold = 500  # Adjust based on microphone sensitivity
@@ -132,20 +231,37 @@ class VoiceRecorder:
     
     def start_recording(self):
         """Start recording audio with auto-stop"""
-        self.frames = []
         self.is_recording = True
         self.last_sound_time = time.time()
         
-        self.stream = self.audio.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=16000,
-            input=True,
-            frames_per_buffer=1024,
-            stream_callback=self.callback
-        )
-        
-        self.stream.start_stream()
+        # Frames go to the WAV file as they arrive - the PortAudio callback
+        # only queues them and a writer thread does the disk I/O
+        self.filename = f"temp_audio_{int(time.time())}.wav"
+        self.wav = wave.open(self.filename, 'wb')
+        try:
+            self.wav.setnchannels(1)
+            self.wav.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
+            self.wav.setframerate(16000)
+            self.frames = queue.SimpleQueue()
+            self.writer_thread = threading.Thread(target=self._write_frames, daemon=True)
+            self.writer_thread.start()
+            
+            self.stream = self.audio.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=16000,
+                input=True,
+                frames_per_buffer=1024,
+                stream_callback=self.callback
+            )
+            
+            self.stream.start_stream()
+        except:
+            # No input device (or it refused the format) - don't leave the
+            # WAV handle, temp file and blocked writer thread behind
+            self.is_recording = False
+            self.cleanup()
+            raise
         
         # Start silence detection thread
         self.silence_thread = threading.Thread(target=self._detect_silence, daemon=True)
@@ -159,34 +275,39 @@ class VoiceRecorder:
                 break
             time.sleep(0.1)
     
+    def _write_frames(self):
+        """Write queued frames to the WAV file until None arrives"""
+        while (frames := self.frames.get()) is not None:
+            self.wav.writeframesraw(frames)
+    
     def stop_recording(self) -> str:
-        """Stop recording and save to file"""
+        """Stop recording and return the finished WAV file"""
         self.is_recording = False
         
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
         
-        # Save to file
-        filename = f"temp_audio_{int(time.time())}.wav"
-        wf = wave.open(filename, 'wb')
-        wf.setnchannels(1)
-        wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-        wf.setframerate(16000)
-        wf.writeframes(b''.join(self.frames))
-        wf.close()
+        # Let the writer drain the queue, then finish the header (frame count)
+        self.frames.put(None)
+        self.writer_thread.join()
+        self.writer_thread = None
+        self.wav.close()
+        self.wav = None
         
-        return filename
+        return self.filename
     
     def callback(self, in_data, frame_count, time_info, status):
         """Audio callback with silence detection"""
         if self.is_recording:
-            self.frames.append(in_data)
+            self.frames.put(in_data)
             
-            # Check for sound (simple amplitude-based detection)
+            # Check for sound (simple amplitude-based detection) - max/min
+            # scan the int16 samples in C without copying the buffer
             try:
-                audio_data = np.frombuffer(in_data, dtype=np.int16)
-                max_amplitude = np.max(np.abs(audio_data))
+                samples = memoryview(in_data).cast('h')
+                max_amplitude = max(max(samples), -min(samples)) if samples else 0
                 
                 if max_amplitude > self.silence_threshold:
                     self.last_sound_time = time.time()
@@ -196,11 +317,44 @@ class VoiceRecorder:
         return (in_data, pyaudio.paContinue)
     
     def cleanup(self):
-        """Cleanup resources"""
+        """Cleanup resources - PA itself stays open for the next recording"""
+        self.is_recording = False
+        try:
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+        except:
+            pass
+        
+        # Stop a writer that stop_recording never reached
+        if self.writer_thread:
+            self.frames.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+        
         try:
-            self.audio.terminate()
+            if self.wav:
+                self.wav.close()
         except:
             pass
+        self.wav = None
+        
+        # The temp WAV is only needed while the voice input is processed
+        if self.filename:
+            try:
+                os.remove(self.filename)
+            except OSError:
+                pass
+            self.filename = None
+
+class TkThreadProxy:
+    """Stand-in for the GUI on other threads - method calls are queued for the Tk thread"""
+    
+    def __init__(self, calls):
+        self._calls = calls
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.put((name, args, kwargs))
 
 class ShadowGUIApp:
     def __init__(self):
@@ -208,13 +362,40 @@ class ShadowGUIApp:
             raise ImportError("Required modules not available")
             
         self.gui = ShadowGUI(on_user_input_callback=self._on_user_input)
+        
+        # Tk widgets may only be touched from the Tk thread. BG_LOOP
+        # coroutines and the weather worker go through self.ui instead,
+        # whose calls _drain_gui_calls runs on the Tk thread
+        self._gui_calls = queue.SimpleQueue()
+        self.ui = TkThreadProxy(self._gui_calls)
+        self._drain_gui_calls()
         self.weather_service = WeatherService()
         self._setup_gui()
         self.voice_recorder = None
         
+        # Set when the app closes, so background workers stop straight away
+        self._stop = threading.Event()
+        
+        # Running voice/text tasks - the loop only keeps weak references
+        self._tasks = set()
+        
         # Start weather updates
         self._start_weather_updates()
     
+    def _drain_gui_calls(self):
+        """Run GUI calls queued by other threads, then check again shortly"""
+        while True:
+            try:
+                name, args, kwargs = self._gui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                getattr(self.gui, name)(*args, **kwargs)
+            except Exception as e:
+                print(f"GUI update error: {e}")
+        
+        self.gui.after(50, self._drain_gui_calls)
+    
     def _setup_gui(self):
         """Setup initial GUI state"""
         self.gui.write_shadow("🌌 Shadow AI Online")
@@ -224,8 +405,7 @@ class ShadowGUIApp:
         self.gui.write_shadow("🌤️  Weather: Auto-updates every 10 minutes")
         self.gui.write_shadow("=" * 40)
         
-        # Set initial weather
-        self._update_weather_display()
+        # The weather worker fills in the initial weather off the Tk thread
     
     def _start_weather_updates(self):
         """Start background weather updates"""
@@ -233,10 +413,12 @@ class ShadowGUIApp:
             while True:
                 try:
                     self._update_weather_display()
-                    time.sleep(600)  # Update every 10 minutes
+                    if self._stop.wait(600):  # Update every 10 minutes
+                        return
                 except Exception as e:
                     print(f"Weather update error: {e}")
-                    time.sleep(60)  # Retry after 1 minute on error
+                    if self._stop.wait(60):  # Retry after 1 minute on error
+                        return
         
         threading.Thread(target=weather_worker, daemon=True).start()
     
@@ -249,14 +431,14 @@ class ShadowGUIApp:
             
             # Update GUI if it has a weather label
             if hasattr(self.gui, 'weather_label'):
-                self.gui.weather_label.configure(text=weather_text)
+                self.ui.set_weather(weather_text)
             else:
                 print(f"Weather: {weather_text.split(chr(10))[0]}")  # Print first line to console
                 
         except Exception as e:
             error_text = f"🌡️ Weather unavailable\nCheck API key"
             if hasattr(self.gui, 'weather_label'):
-                self.gui.weather_label.configure(text=error_text)
+                self.ui.set_weather(error_text)
     
     def _on_user_input(self, text):
         """Handle all user input from GUI"""
@@ -273,31 +455,19 @@ class ShadowGUIApp:
     
     def _handle_weather_query(self, text):
         """Handle weather-related queries"""
-        try:
-            # Extract city from query (e.g., "weather London" or "weather in Paris")
-            city = "London"  # default
-            if "weather" in text.lower():
-                parts = text.lower().split("weather")[1].strip()
-                if parts.startswith("in"):
-                    parts = parts[2:].strip()
-                if parts:
-                    city = parts.split()[0].title()
-            
-            self.gui.write_shadow(f"🌤️  Checking weather for {city}...")
-            
-            # Get weather for specified city
-            weather_data = self.weather_service.get_weather(city)
-            weather_text = self.weather_service.format_weather_text(weather_data)
-            
-            if 'error' in weather_data:
-                self.gui.write_shadow(f"❌ {weather_data['error']}")
-            else:
-                self.gui.write_shadow(f"🌤️  Weather in {city}:\n{weather_text}")
-                
-        except Exception as e:
-            self.gui.write_shadow(f"❌ Weather query error: {e}")
-        finally:
-            self.gui.enable_input()
+        # Extract city from query (e.g., "weather London" or "weather in Paris")
+        city = "London"  # default
+        if "weather" in text.lower():
+            parts = text.lower().split("weather")[1].strip()
+            if parts.startswith("in"):
+                parts = parts[2:].strip()
+            if parts:
+                city = parts.split()[0].title()
+        
+        self.gui.write_shadow(f"🌤️  Checking weather for {city}...")
+        
+        # The lookup may hit the network - keep it off the Tk thread
+        self._run_in_background(self._process_weather(city))
     
     def _handle_voice_input(self):
         """Start voice input processing"""
@@ -305,10 +475,7 @@ class ShadowGUIApp:
             self.gui.set_voice_recording(True)
             
             # Run voice processing in background
-            asyncio.run_coroutine_threadsafe(
-                self._process_voice(), 
-                BG_LOOP
-            )
+            self._run_in_background(self._process_voice())
         except Exception as e:
             self.gui.write_shadow(f"❌ Voice start error: {e}")
             self.gui.set_voice_recording(False)
@@ -318,10 +485,16 @@ class ShadowGUIApp:
         self.gui.set_thinking(True)
         
         # Run text processing in background
-        asyncio.run_coroutine_threadsafe(
-            self._process_text(text), 
-            BG_LOOP
-        )
+        self._run_in_background(self._process_text(text))
+    
+    def _run_in_background(self, coro):
+        """Start a coroutine on BG_LOOP without waiting for, or returning, its result"""
+        def start():
+            task = asyncio.ensure_future(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        
+        BG_LOOP.call_soon_threadsafe(start)
     
     async def _process_voice(self):
         """Process voice input"""
@@ -329,7 +502,7 @@ class ShadowGUIApp:
         try:
             # Initialize voice recorder
             recorder = VoiceRecorder()
-            self.gui.write_shadow("🎤 Recording... Speak now")
+            self.ui.write_shadow("🎤 Recording... Speak now")
             
             # Start recording
             recorder.start_recording()
@@ -343,10 +516,10 @@ class ShadowGUIApp:
             audio_file = recorder.stop_recording()
             
             if os.path.exists(audio_file) and os.path.getsize(audio_file) > 0:
-                self.gui.write_shadow("✅ Processing audio...")
+                self.ui.write_shadow("✅ Processing audio...")
                 
                 # Use Shadow AI to process voice
-                await SHADOW.process_voice_input(audio_file, self.gui)
+                await SHADOW.process_voice_input(audio_file, self.ui)
                 
                 # Cleanup
                 try:
@@ -354,10 +527,10 @@ class ShadowGUIApp:
                 except:
                     pass
             else:
-                self.gui.write_shadow("❌ No audio detected. Please try again.")
+                self.ui.write_shadow("❌ No audio detected. Please try again.")
                     
         except Exception as e:
-            self.gui.write_shadow(f"❌ Voice processing error: {e}")
+            self.ui.write_shadow(f"❌ Voice processing error: {e}")
         finally:
             # Cleanup recorder
             if recorder:
@@ -365,17 +538,34 @@ class ShadowGUIApp:
                     recorder.cleanup()
                 except:
                     pass
-            self.gui.set_voice_recording(False)
-            self.gui.enable_input()
+            self.ui.set_voice_recording(False)
+            self.ui.enable_input()
+    
+    async def _process_weather(self, city):
+        """Process a weather query"""
+        try:
+            # Get weather for specified city
+            weather_data = await asyncio.to_thread(self.weather_service.get_weather, city)
+            weather_text = self.weather_service.format_weather_text(weather_data)
+            
+            if 'error' in weather_data:
+                self.ui.write_shadow(f"❌ {weather_data['error']}")
+            else:
+                self.ui.write_shadow(f"🌤️  Weather in {city}:\n{weather_text}")
+                
+        except Exception as e:
+            self.ui.write_shadow(f"❌ Weather query error: {e}")
+        finally:
+            self.ui.enable_input()
     
     async def _process_text(self, text):
         """Process text input"""
         try:
-            await SHADOW.process_text_input(text, self.gui)
+            await SHADOW.process_text_input(text, self.ui)
         except Exception as e:
-            self.gui.write_shadow(f"❌ Text processing error: {e}")
+            self.ui.write_shadow(f"❌ Text processing error: {e}")
         finally:
-            self.gui.enable_input()
+            self.ui.enable_input()
     
     def run(self):
         """Start the application"""
@@ -385,23 +575,21 @@ class ShadowGUIApp:
             print(f"❌ Application error: {e}")
         finally:
             # Cleanup on exit
+            self._stop.set()
             if self.voice_recorder:
                 self.voice_recorder.cleanup()
 
 def check_microphone():
     """Check if microphone is available"""
     try:
-        audio = pyaudio.PyAudio()
-        
-        # Check for available microphones
-        info = audio.get_default_input_device_info()
+        # Check for available microphones - on the shared instance the
+        # recorder uses later, so PortAudio is only initialized once
+        info = PA.get_default_input_device_info()
         if info:
             print(f"🎤 Microphone found: {info.get('name', 'Unknown')}")
-            audio.terminate()
             return True
         else:
             print("❌ No microphone found")
-            audio.terminate()
             return False
     except Exception as e:
         print(f"❌ Microphone check failed: {e}")